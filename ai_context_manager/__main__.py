@@ -1,11 +1,19 @@
-# ai_context_manager/__main__.py (Improved Version)
+"""Makes the ai_context_manager package executable via ``python -m``."""
+import sys
 
-"""
-Makes the ai_context_manager package executable.
-Invokes the main CLI application defined in ai_context_manager.cli.
-"""
 
-from ai_context_manager.cli import app
+def main() -> None:
+    """Console entry point; answers version queries before Typer or Rich is imported."""
+    if len(sys.argv) >= 2 and sys.argv[1] in {"version", "--version", "-V"}:
+        from ai_context_manager.config import VERSION_BANNER
+
+        print(VERSION_BANNER)
+        return
+
+    from ai_context_manager.cli import app
+
+    app()
+
 
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    main()
@@ -1,29 +1,88 @@
 """Main CLI entry point."""
+import importlib
+from typing import Any, List, Optional
+
 import typer
-from rich.console import Console
-from ai_context_manager.commands import select_cmd, export_cmd, generate_cmd, chat_cmd
-from ai_context_manager.config import CLI_CONTEXT_SETTINGS
+from typer.core import TyperCommand, TyperGroup
+from ai_context_manager.config import CLI_CONTEXT_SETTINGS, VERSION_BANNER
+
+# Subcommand name -> (module path, help text). Modules are only imported when
+# the matching subcommand is invoked, keeping `--help` and `version` cheap.
+LAZY_SUBCOMMANDS = {
+    "select": ("ai_context_manager.commands.select_cmd", "Open visual file selector"),
+    "export": ("ai_context_manager.commands.export_cmd", "Native: Generate context from selection.yaml"),
+    "generate": ("ai_context_manager.commands.generate_cmd", "Repomix: Generate context using external tool"),
+    "chat": ("ai_context_manager.commands.chat_cmd", "RAG: Index selections & ask questions"),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root group that imports subcommand modules on first use."""
+
+    _formatting_help = False
+
+    def list_commands(self, ctx: typer.Context) -> List[str]:
+        lazy = [name for name in LAZY_SUBCOMMANDS if name not in self.commands]
+        return super().list_commands(ctx) + lazy
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Optional[Any]:
+        if cmd_name in self.commands or cmd_name not in LAZY_SUBCOMMANDS:
+            return super().get_command(ctx, cmd_name)
+
+        module_path, help_text = LAZY_SUBCOMMANDS[cmd_name]
+        if self._formatting_help:
+            # Listing in the root help only needs the name and help text.
+            return TyperCommand(cmd_name, help=help_text)
+
+        module = importlib.import_module(module_path)
+        command = typer.main.get_group(module.app)
+        command.name = cmd_name
+        command.help = help_text
+        self.commands[cmd_name] = command
+        return command
+
+    def format_help(self, ctx: typer.Context, formatter: Any) -> None:
+        self._formatting_help = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
+
 
 app = typer.Typer(
     name="aicontext",
     help="Visual Context Manager - Select files visually and export for AI.",
     add_completion=False,
     context_settings=CLI_CONTEXT_SETTINGS,
+    cls=LazyTyperGroup,
 )
-console = Console()
+_console = None
+
+
+def get_console():
+    """Return the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+@app.callback()
+def main() -> None:
+    # Subcommands are registered lazily, so an explicit callback keeps the
+    # root a group instead of collapsing it into the lone `version` command.
+    pass
 
-app.add_typer(select_cmd.app, name="select", help="Open visual file selector")
-app.add_typer(export_cmd.app, name="export", help="Native: Generate context from selection.yaml")
-app.add_typer(generate_cmd.app, name="generate", help="Repomix: Generate context using external tool")
-app.add_typer(chat_cmd.app, name="chat", help="RAG: Index selections & ask questions")
 
 @app.command()
 def version():
     """Show version information."""
-    console.print("AI Context Manager v0.2.0 (Visual Edition)")
+    get_console().print(VERSION_BANNER)
 
 if __name__ == "__main__":
     app()
 
 # Backwards compatibility
-cli = app
\ No newline at end of file
+cli = app
@@ -1,5 +1,14 @@
-"""Expose command interfaces."""
+"""Expose command interfaces.
 
-from . import select_cmd, export_cmd, generate_cmd, chat_cmd
+Command modules are imported on attribute access only, so loading one
+subcommand does not import the others.
+"""
+import importlib
 
-__all__ = ["select_cmd", "export_cmd", "generate_cmd", "chat_cmd"]
\ No newline at end of file
+__all__ = ["select_cmd", "export_cmd", "generate_cmd", "chat_cmd"]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f"{__name__}.{name}")
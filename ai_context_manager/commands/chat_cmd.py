@@ -3,37 +3,50 @@
 from __future__ import annotations
 
 import json
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, List
 
 import typer
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.syntax import Syntax
 
 from ai_context_manager.config import CLI_CONTEXT_SETTINGS
 from ai_context_manager.core.selection import Selection
 
-try:  # Optional dependencies
-    from ai_context_manager.core.rag import RAGEngine
-
-    RAG_AVAILABLE = True
-except ImportError:  # pragma: no cover - runtime warning
-    RAG_AVAILABLE = False
-
 
 app = typer.Typer(
     name="chat",
     help="Index selections into Qdrant and chat over them",
     context_settings=CLI_CONTEXT_SETTINGS,
 )
-console = Console()
+_console = None
+
+_MAX_CACHED_ANSWERS = 64
+
 
+def get_console():
+    """Return the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
 
-def _ensure_deps() -> None:
-    if not RAG_AVAILABLE:
+        _console = Console()
+    return _console
+
+
+def _ensure_deps() -> type:
+    """Import the RAG engine on demand; exit with an install hint if extras are missing."""
+    try:  # Optional dependencies
+        from ai_context_manager.core import rag
+    except ImportError:  # pragma: no cover - runtime warning
+        rag = None
+
+    if rag is None or rag.QdrantClient is None or rag.OpenAI is None:
+        console = get_console()
         console.print("[red]AI dependencies missing.[/red]")
-        console.print("Run: [bold]uv pip install -e '.[ai]'[/bold]")
+        console.print("Run: [bold]uv pip install -e '.\\[ai]'[/bold]")
         raise typer.Exit(1)
+    return rag.RAGEngine
 
 
 @app.command("index")
@@ -42,7 +55,8 @@ def index_cmd(
 ) -> None:
     """Index files from a selection into Qdrant."""
 
-    _ensure_deps()
+    RAGEngine = _ensure_deps()
+    console = get_console()
 
     try:
         selection = Selection.load(selection_file)
@@ -63,7 +77,11 @@ def ask_cmd(
 ) -> None:
     """Ask questions against indexed vectors."""
 
-    _ensure_deps()
+    from rich.console import Group
+    from rich.markdown import Markdown
+
+    RAGEngine = _ensure_deps()
+    console = get_console()
 
     empty_selection = Selection(base_path=Path("."), include_paths=[])
 
@@ -73,26 +91,42 @@ def ask_cmd(
         console.print(f"[red]Failed to initialize RAG engine: {exc}[/red]")
         raise typer.Exit(1)
 
+    # Recent answers for this session, keyed by the stripped question and
+    # evicted least recently used first
+    answers: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
     def _ask(q: str) -> None:
-        with console.status("[bold blue]Thinking..."):
-            result = engine.query(q)
-        
-        # Print Answer
-        console.print(Markdown(result["answer"]))
+        key = q.strip()
+        cached = key in answers
+        if cached:
+            answers.move_to_end(key)
+            result = answers[key]
+        else:
+            with console.status("[bold blue]Thinking..."):
+                result = engine.query(q)
+            answers[key] = result
+            if len(answers) > _MAX_CACHED_ANSWERS:
+                answers.popitem(last=False)
         
-        # Print Sources
+        # Build answer and sources, then print them in one go
+        renderables: List[Any] = [Markdown(result["answer"])]
+        if cached:
+            renderables.append("[dim](cached)[/dim]")
+
         sources = result.get("sources", [])
         if sources:
-            console.print()
-            console.print("[bold]Sources:[/bold]")
+            renderables.append("")
+            renderables.append("[bold]Sources:[/bold]")
             seen = set()
             for source in sources:
                 path = source.get("path")
                 # Deduplicate based on path to avoid listing same file multiple times if multiple chunks matched
                 if path and path not in seen:
-                    console.print(f" • [cyan]{source.get('filename')}[/cyan] [dim]({path})[/dim]")
+                    renderables.append(f" • [cyan]{source.get('filename')}[/cyan] [dim]({path})[/dim]")
                     seen.add(path)
 
+        console.print(Group(*renderables))
+
     if question:
         _ask(question)
         return
@@ -105,15 +139,24 @@ def ask_cmd(
         _ask(q)
 
 
+@lru_cache(maxsize=None)
+def _load_schema_text(schema_path: Path) -> str:
+    """Read the frontmatter schema once per process."""
+    return schema_path.read_text()
+
+
 @app.command("schema")
 def schema_cmd() -> None:
     """Print the documentation frontmatter JSON schema."""
 
+    from rich.syntax import Syntax
+
+    console = get_console()
     schema_path = Path(__file__).parent.parent / "schemas" / "frontmatter.json"
 
     if not schema_path.exists():
         console.print("[red]Schema file not found.[/red]")
         raise typer.Exit(1)
 
-    schema_content = schema_path.read_text()
+    schema_content = _load_schema_text(schema_path)
     console.print(Syntax(schema_content, "json", theme="monokai", word_wrap=True))
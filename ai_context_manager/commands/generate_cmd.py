@@ -1,20 +1,24 @@
 # ai_context_manager/commands/generate_cmd.py
 
 """Command to generate context via Repomix (native implementation)."""
+import hashlib
+import os
+import stat
+import sys
 import tempfile
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Optional, Set
+from typing import Any, Callable, List, Optional, Set, Union
 
 import typer
-import yaml
 from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
 
-from ..config import CLI_CONTEXT_SETTINGS
+from ..config import CLI_CONTEXT_SETTINGS, get_cache_dir
 from ..core.native_context.generator import NativeContextGenerator
-from ..utils.clipboard import copy_file_uri_to_clipboard
+from ..utils.file_utils import iter_files, write_text_atomic
 
 app = typer.Typer(help="Generate context using native XML generator", context_settings=CLI_CONTEXT_SETTINGS)
 console = Console()
@@ -31,30 +35,72 @@ _METADATA_HINT_KEYS = {
     "project",
 }
 
+# Generated outputs kept in the cache directory before the oldest are pruned;
+# whichever limit is hit first applies
+_MAX_CACHED_OUTPUTS = 32
+_MAX_CACHED_BYTES = 64 * 1024 * 1024
+# Longest tag list spelled out in a default output name before it is truncated
+_MAX_TAG_NAME_CHARS = 64
 
-def _count_files_and_folders(include_items: List[str], base_path: Path) -> tuple[int, int, List[str]]:
+# Directories with fewer selection files than this are scanned sequentially
+_PARALLEL_SCAN_THRESHOLD = 32
+
+# Parsed selections, keyed by (path, mtime_ns, size, inode, ctime_ns) and
+# evicted least recently used first; tag scans fill it from worker threads
+_MAX_CACHED_SELECTIONS = 256
+_selection_cache: "OrderedDict[tuple, dict]" = OrderedDict()
+_selection_cache_lock = threading.Lock()
+
+
+def _stat_include_item(item: str, base_str: str) -> tuple[str, Optional[int]]:
     """
-    Count files and folders in a selection's include list.
-    Returns: (file_count, folder_count, missing_files)
+    Normalize an include item against base_str and stat it once.
+    Paths are normalized lexically as strings (no symlink resolution, no Path
+    objects); base_str is expected to be resolved already.
+    Returns (full_path_str, st_mode), with None for missing paths.
     """
-    file_count = 0
-    folder_count = 0
-    missing_files = []
-    
-    for item in include_items:
-        path_obj = Path(item)
-        full_path = path_obj if path_obj.is_absolute() else (base_path / path_obj).resolve()
-        
-        if not full_path.exists():
-            missing_files.append(item)
-            continue
-            
-        if full_path.is_file():
-            file_count += 1
-        elif full_path.is_dir():
-            folder_count += 1
-    
-    return file_count, folder_count, missing_files
+    full_str = os.path.normpath(os.path.join(base_str, item))  # join keeps absolute items
+    return full_str, _path_mode(full_str)
+
+
+@lru_cache(maxsize=8192)
+def _path_mode(path_str: str) -> Optional[int]:
+    """
+    st_mode of a normalized path, or None if it cannot be stat'ed.
+    Memoized on the normalized path, so the same file reached through different
+    items or bases is stat'ed once; callers clear the cache when a new command
+    run starts.
+    """
+    try:
+        return os.stat(path_str).st_mode
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_output(cache_file: Path, content: str) -> None:
+    """Save generated output for reuse, keeping only the newest entries."""
+    if len(content.encode("utf-8")) > _MAX_CACHED_BYTES:
+        # Would evict everything else and still be over budget
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        write_text_atomic(cache_file, content)
+        # One scandir pass over at most _MAX_CACHED_OUTPUTS + 1 entries
+        entries = []
+        with os.scandir(cache_file.parent) as it:
+            for entry in it:
+                if entry.name.endswith(".xml") and entry.is_file():
+                    st = entry.stat()
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+        entries.sort(reverse=True)
+        total = 0
+        for kept, (_, size, path) in enumerate(entries):
+            total += size
+            if kept >= _MAX_CACHED_OUTPUTS or total > _MAX_CACHED_BYTES:
+                os.unlink(path)
+    except OSError:
+        # The cache is an optimization only; never fail generation over it
+        pass
 
 
 def _format_path(path: Path, is_dir: bool, highlight: str) -> str:
@@ -67,6 +113,8 @@ def _format_path(path: Path, is_dir: bool, highlight: str) -> str:
 
 def _print_tree_view(include_details: List[tuple[Path, bool]], execution_root: Path) -> None:
     """Prints a tree view of the included files and directories."""
+    from rich.tree import Tree
+
     tree = Tree(
         f"Included Content",
         guide_style="bold bright_blue",
@@ -75,11 +123,16 @@ def _print_tree_view(include_details: List[tuple[Path, bool]], execution_root: P
     dirs = sorted([p for p, is_dir in include_details if is_dir])
     files = sorted([p for p, is_dir in include_details if not is_dir])
 
-    # Remove subdirectories from the list
-    root_dirs = [d for d in dirs if not any(d != other_d and d.is_relative_to(other_d) for other_d in dirs)]
+    # Remove subdirectories from the list. Sorted paths place every descendant
+    # right after its ancestor, so comparing with the last kept root suffices.
+    root_dirs: List[Path] = []
+    for d in dirs:
+        if not root_dirs or not d.is_relative_to(root_dirs[-1]):
+            root_dirs.append(d)
 
     # Remove files that are in one of the root directories
-    standalone_files = [f for f in files if not any(f.is_relative_to(d) for d in root_dirs)]
+    root_set = set(root_dirs)
+    standalone_files = [f for f in files if root_set.isdisjoint(f.parents)]
 
     # Add directories to tree
     for d in root_dirs:
@@ -87,7 +140,7 @@ def _print_tree_view(include_details: List[tuple[Path, bool]], execution_root: P
             relative_dir_path = d.relative_to(execution_root)
             dir_node = tree.add(f":open_file_folder: [cyan]{relative_dir_path}/[/cyan]")
 
-            all_files_in_dir = sorted([f for f in d.rglob("*") if f.is_file()])
+            all_files_in_dir = sorted(Path(f) for f in iter_files(d))
 
             if not all_files_in_dir:
                 dir_node.add("[dim]No files found.[/dim]")
@@ -115,53 +168,98 @@ def _print_metadata(
 ) -> None:
     """Print extracted metadata to the console."""
     meta = meta or {}
+    # Lines are collected and printed in one console call
+    lines = [f"[bold blue]Processing: {filename}[/bold blue]"]
 
-    console.print(f"[bold blue]Processing: {filename}[/bold blue]")
     if absolute_path:
-        console.print(f"  File Path: {_format_path(absolute_path, absolute_path.is_dir(), 'magenta')}")
+        lines.append(f"  File Path: {_format_path(absolute_path, absolute_path.is_dir(), 'magenta')}")
 
     description = meta.get("description")
     if description:
-        console.print(f"  Description: [green]{description}[/green]")
+        lines.append(f"  Description: [green]{description}[/green]")
 
     tags = meta.get("tags", [])
     if tags:
-        console.print(f"  Tags:        {', '.join(tags)}")
+        lines.append(f"  Tags:        {', '.join(tags)}")
 
     related = meta.get("relatedTags", [])
     if related:
-        console.print(f"  See Also:    [italic cyan]{', '.join(related)}[/italic cyan]")
+        lines.append(f"  See Also:    [italic cyan]{', '.join(related)}[/italic cyan]")
 
     if "updatedAt" in meta:
         by = f" by {meta['updatedBy']}" if meta.get("updatedBy") else ""
-        console.print(f"  Updated:     {meta['updatedAt']}{by}")
+        lines.append(f"  Updated:     {meta['updatedAt']}{by}")
     elif "createdAt" in meta:
         by = f" by {meta['createdBy']}" if meta.get("createdBy") else ""
-        console.print(f"  Created:     {meta['createdAt']}{by}")
+        lines.append(f"  Created:     {meta['createdAt']}{by}")
 
     # Show file/folder counts if provided
     if file_count > 0 or folder_count > 0:
-        console.print(f"  Files:       [cyan]{file_count}[/cyan]")
-        console.print(f"  Folders:     [cyan]{folder_count}[/cyan]")
+        lines.append(f"  Files:       [cyan]{file_count}[/cyan]")
+        lines.append(f"  Folders:     [cyan]{folder_count}[/cyan]")
 
-    console.print()
+    # Trailing empty line keeps the blank spacer after each block
+    lines.append("")
+    console.print("\n".join(lines))
 
 
 def _load_selection(path: Path) -> dict:
     """
     Load YAML, handling multi-document streams (Metadata + Content).
     Returns normalized dict: {'meta': {}, 'content': {}}
+
+    Results are cached per file until its mtime, size, inode or ctime
+    changes; callers must treat the returned dict as read-only.
+    """
+    result = _try_load_selection(path)
+    if isinstance(result, Exception):
+        console.print(f"[red]Error parsing {path}: {result}[/red]")
+        raise typer.Exit(1)
+    return result
+
+
+def _try_load_selection(
+    path: Path, accept: Optional[Callable[[bytes], bool]] = None
+) -> Union[dict, Exception, None]:
+    """
+    Like _load_selection, but returns the error instead of printing it; thread-safe.
+
+    A cache hit costs one stat. On a miss the file is read once; if accept is
+    given and rejects those bytes, None is returned without parsing.
     """
     try:
-        with open(path, "r", encoding="utf-8") as file:
-            documents = list(yaml.safe_load_all(file))
+        st = path.stat()
+        key = (str(path.absolute()), st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns)
+        with _selection_cache_lock:
+            cached = _selection_cache.get(key)
+            if cached is not None:
+                _selection_cache.move_to_end(key)
+                return cached
+
+        raw = path.read_bytes()
+        if accept is not None and not accept(raw):
+            return None
+        data = _parse_selection(raw)
+
+        with _selection_cache_lock:
+            _selection_cache[key] = data
+            if len(_selection_cache) > _MAX_CACHED_SELECTIONS:
+                _selection_cache.popitem(last=False)
+        return data
     except Exception as exc:
-        console.print(f"[red]Error parsing {path}: {exc}[/red]")
-        raise typer.Exit(1)
+        return exc
+
+
+def _parse_selection(raw: bytes) -> dict:
+    """Parse and normalize the bytes of a selection file."""
+    import yaml
 
     final_data: dict[str, dict[str, Any]] = {"meta": {}, "content": {}}
 
-    for doc in documents:
+    # The whole file as one byte buffer; libyaml detects the encoding itself.
+    # Documents are still parsed lazily, so anything after a combined
+    # meta+content document is skipped.
+    for doc in yaml.load_all(raw, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
         if not isinstance(doc, dict):
             continue
 
@@ -197,9 +295,34 @@ def _load_selection(path: Path) -> dict:
             if _METADATA_HINT_KEYS.intersection(doc.keys()):
                 final_data["meta"].update(doc)
 
+    # Tags repeat across many files; interned copies share one object and
+    # hash-compare by identity in the tag Counter and set checks.
+    tags = final_data["meta"].get("tags")
+    if isinstance(tags, list):
+        final_data["meta"]["tags"] = [sys.intern(tag) if type(tag) is str else tag for tag in tags]
+
     return final_data
 
 
+def _list_yaml_files(directory: Path) -> List[Path]:
+    """Return the *.yaml and *.yml files directly in directory, sorted, from one scandir pass."""
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path) for entry in entries if entry.name.endswith((".yaml", ".yml")) and entry.is_file()
+        )
+
+
+def _scan_selection_files(
+    candidates: List[Path], load: Callable[[Path], Any] = _try_load_selection
+) -> List[Any]:
+    """Apply load to every candidate, in order; large directories are read in parallel."""
+    if len(candidates) < _PARALLEL_SCAN_THRESHOLD:
+        return [load(path) for path in candidates]
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(load, candidates))
+
+
 def _ensure_content(node: dict, field: str, file: Path) -> Any:
     if "content" not in node or field not in node["content"]:
         console.print(
@@ -209,6 +332,47 @@ def _ensure_content(node: dict, field: str, file: Path) -> Any:
     return node["content"][field]
 
 
+def _may_contain_tags(raw: bytes, tags: Set[str]) -> bool:
+    """
+    Cheap pre-check on a file's bytes: False only if no requested tag can be in it.
+    A tag can only be spelled differently through an escape sequence, so files
+    containing a backslash always go on to the full parse, as do UTF-16/32
+    files (BOM or NUL bytes), which the UTF-8 comparison cannot rule out.
+    """
+    if b"\\" in raw or b"\x00" in raw or raw.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return True
+    return any(tag.encode("utf-8") in raw for tag in tags)
+
+
+def _default_output_name(selection_files: List[Path], tags: Optional[List[str]]) -> str:
+    """
+    Name for the temp output file. Merged selections and overlong tag lists get
+    a short digest of their inputs, so different inputs do not overwrite each
+    other's output and names stay well under filesystem limits.
+    """
+    def digest() -> str:
+        inputs = sorted(tags or []) + sorted(str(path.resolve()) for path in selection_files)
+        return hashlib.blake2b("\0".join(inputs).encode("utf-8"), digest_size=4).hexdigest()
+
+    if tags:
+        joined = "_".join(tags)
+        if len(joined) > _MAX_TAG_NAME_CHARS:
+            return f"context_{joined[:_MAX_TAG_NAME_CHARS]}_{digest()}"
+        return f"context_{joined}"
+
+    name = selection_files[0].stem.replace(" ", "_")
+    if len(selection_files) > 1:
+        name = f"{name}_merged_{digest()}"
+    return name
+
+
+def _resolve_base_path(raw_base: str, selection_file: Path) -> Path:
+    """Resolve a selection's basePath; relative paths are taken from the file's directory."""
+    if Path(raw_base).is_absolute():
+        return Path(raw_base).resolve()
+    return (selection_file.parent / raw_base).resolve()
+
+
 def _find_files_by_tags(directory: Path, tags: List[str], verbose: bool = False) -> List[Path]:
     """
     Scan a directory and return YAML files whose meta.tags intersect the requested tags.
@@ -220,44 +384,55 @@ def _find_files_by_tags(directory: Path, tags: List[str], verbose: bool = False)
         console.print(f"[red]Error: Directory {directory} not found.[/red]")
         raise typer.Exit(1)
 
-    candidates = list(directory.glob("*.yaml")) + list(directory.glob("*.yml"))
+    candidates = _list_yaml_files(directory)
 
     if verbose:
         console.print(
             f"[dim]Scanning {len(candidates)} files in {directory} for tags: {', '.join(tags)}[/dim]"
         )
 
-    for file_path in candidates:
-        try:
-            data = _load_selection(file_path)
-        except Exception as exc:
+    def accept(raw: bytes) -> bool:
+        return _may_contain_tags(raw, required_tags)
+
+    def load(file_path: Path) -> Union[dict, Exception, None]:
+        # Verbose output lists every file's tags, so it always needs the parse.
+        # Otherwise files that cannot hold a requested tag are skipped
+        # unparsed, so broken YAML among them is not reported.
+        return _try_load_selection(file_path, None if verbose else accept)
+
+    # Per-file lines are collected and printed once, instead of one
+    # console.print (markup parse + write) per candidate
+    log_lines: List[str] = []
+
+    for file_path, data in zip(candidates, _scan_selection_files(candidates, load)):
+        if data is None:
+            continue
+        if isinstance(data, Exception):
+            log_lines.append(f"[red]Error parsing {file_path}: {data}[/red]")
             if verbose:
-                console.print(
-                    f"[yellow]  ⚠ Skipping {file_path.name}: Parsing error ({exc})[/yellow]"
-                )
+                log_lines.append(f"[yellow]  ⚠ Skipping {file_path.name}: Parsing error ({data})[/yellow]")
             continue
 
         file_meta = data.get("meta", {})
         raw_tags = file_meta.get("tags", [])
         if not isinstance(raw_tags, list):
             raw_tags = []
-        file_tags = set(raw_tags)
+        # isdisjoint takes the list as is; a per-file set is only built for display
+        matched = not required_tags.isdisjoint(raw_tags)
 
         if verbose:
+            file_tags = set(raw_tags)
             tag_str = ", ".join(sorted(file_tags)) if file_tags else "<none>"
-            if required_tags.isdisjoint(file_tags):
-                console.print(
-                    f"[dim]  • {file_path.name}: [yellow]No match[/yellow] (Found: {tag_str})[/dim]"
-                )
+            if not matched:
+                log_lines.append(f"[dim]  • {file_path.name}: [yellow]No match[/yellow] (Found: {tag_str})[/dim]")
             else:
-                console.print(
-                    f"[dim]  • {file_path.name}: [green]Match[/green] (Found: {tag_str})[/dim]"
-                )
+                log_lines.append(f"[dim]  • {file_path.name}: [green]Match[/green] (Found: {tag_str})[/dim]")
 
-        if required_tags.isdisjoint(file_tags):
-            continue
+        if matched:
+            matches.append(file_path)
 
-        matches.append(file_path)
+    if log_lines:
+        console.print("\n".join(log_lines))
 
     return sorted(matches)
 
@@ -272,7 +447,7 @@ def list_available_tags(
     """
     List all unique tags found in context definition files within a directory.
     """
-    candidates = list(context_dir.glob("*.yaml")) + list(context_dir.glob("*.yml"))
+    candidates = _list_yaml_files(context_dir)
 
     if not candidates:
         console.print(f"[yellow]No YAML files found in {context_dir}[/yellow]")
@@ -284,14 +459,13 @@ def list_available_tags(
     if verbose:
         console.print(f"[dim]Scanning {len(candidates)} files...[/dim]")
 
-    for file_path in candidates:
-        try:
-            data = _load_selection(file_path)
-        except Exception as exc:
+    log_lines: List[str] = []
+
+    for file_path, data in zip(candidates, _scan_selection_files(candidates)):
+        if isinstance(data, Exception):
+            log_lines.append(f"[red]Error parsing {file_path}: {data}[/red]")
             if verbose:
-                console.print(
-                    f"[yellow]  ⚠ Skipping {file_path.name}: Parsing error ({exc})[/yellow]"
-                )
+                log_lines.append(f"[yellow]  ⚠ Skipping {file_path.name}: Parsing error ({data})[/yellow]")
             continue
 
         meta = data.get("meta", {})
@@ -300,13 +474,14 @@ def list_available_tags(
         if isinstance(tags, list) and tags:
             tag_counts.update(tags)
             if verbose:
-                console.print(
-                    f"[dim]  • {file_path.name}: Tags -> {', '.join(sorted(tags))}[/dim]"
-                )
+                log_lines.append(f"[dim]  • {file_path.name}: Tags -> {', '.join(sorted(tags))}[/dim]")
         else:
             files_without_tags += 1
             if verbose:
-                console.print(f"[dim]  • {file_path.name}: [yellow]No tags[/yellow][/dim]")
+                log_lines.append(f"[dim]  • {file_path.name}: [yellow]No tags[/yellow][/dim]")
+
+    if log_lines:
+        console.print("\n".join(log_lines))
 
     if not tag_counts:
         console.print(f"[yellow]No tags found in {len(candidates)} files.[/yellow]")
@@ -314,6 +489,8 @@ def list_available_tags(
             console.print(f"[dim]({files_without_tags} files had no tags)[/dim]")
         return
 
+    from rich.table import Table
+
     table = Table(title=f"Available Tags in {context_dir.name}")
     table.add_column("Tag", style="cyan")
     table.add_column("Count", style="green", justify="right")
@@ -349,10 +526,21 @@ def generate_repomix(
         False, "--compress", help="Compress output by extracting essential structure"
     ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed execution info"),
+    cache: bool = typer.Option(
+        False,
+        "--cache",
+        help=(
+            "Reuse a previous output while every matched file keeps its path, size, mtime, ctime "
+            "and inode. Edits that preserve all of them are not detected."
+        ),
+    ),
 ):
     """
     Generate XML context using selection files, or discover them via directory + tags.
     """
+    # Include stats are shared across this run's selections only
+    _path_mode.cache_clear()
+
     # Validate style parameter
     if style != "xml":
         console.print(f"[red]Error: Only 'xml' style is currently supported.[/red]")
@@ -379,8 +567,11 @@ def generate_repomix(
         console.print("[red]Error: No selection files provided. Pass files or use --dir with --tag.[/red]")
         raise typer.Exit(1)
 
-    # Deduplicate while keeping deterministic order
-    final_selection_files = list(dict.fromkeys(final_selection_files))
+    # Deduplicate by resolved path (so ./a.yaml and a.yaml count once), keeping order
+    unique_files: dict[Path, Path] = {}
+    for file_path in final_selection_files:
+        unique_files.setdefault(file_path.resolve(), file_path)
+    final_selection_files = list(unique_files.values())
 
     for file_path in final_selection_files:
         if not file_path.exists():
@@ -392,10 +583,7 @@ def generate_repomix(
 
     first_data = _load_selection(final_selection_files[0])
     raw_base = _ensure_content(first_data, "basePath", final_selection_files[0])
-    if Path(raw_base).is_absolute():
-        execution_root = Path(raw_base).resolve()
-    else:
-        execution_root = (final_selection_files[0].parent / raw_base).resolve()
+    execution_root = _resolve_base_path(raw_base, final_selection_files[0])
 
     if verbose:
         console.print(f"[dim]Using Base Path: {execution_root}[/dim]")
@@ -406,43 +594,69 @@ def generate_repomix(
 
     # 1. Handle Output Path Logic
     if output is None:
-        if tags:
-            sanitized_name = f"context_{'_'.join(tags)}"
-        else:
-            primary_file = final_selection_files[0]
-            sanitized_name = primary_file.stem.replace(" ", "_")
-            if len(final_selection_files) > 1:
-                sanitized_name = f"{sanitized_name}_merged"
+        sanitized_name = _default_output_name(final_selection_files, tags)
         temp_dir = Path(tempfile.gettempdir())
         ext = "md" if style == "markdown" else "xml" if style == "xml" else "txt"
         output = temp_dir / f"acm__{sanitized_name}.{ext}"
 
     output = output.resolve()
 
-    final_patterns: List[str] = []
+    # Patterns are made relative with a string prefix check; both sides are
+    # normalized, and this avoids relative_to() raising for out-of-root items.
+    root_str = str(execution_root)
+    root_prefix = os.path.join(root_str, "")
+    # Insertion-ordered dict: patterns are deduplicated as they are added
+    final_patterns: dict[str, None] = {}
 
     for sel_file in final_selection_files:
         sel_absolute_path = sel_file.resolve()
         data = _load_selection(sel_file)
+        raw_base = _ensure_content(data, "basePath", sel_file)
+        include_items = _ensure_content(data, "include", sel_file)
+        current_base = _resolve_base_path(raw_base, sel_file)
 
-        if data.get("meta"):
-            # Compute file/folder counts
-            include_items = _ensure_content(data, "include", sel_file)
-            raw_base = _ensure_content(data, "basePath", sel_file)
-            
-            if Path(raw_base).is_absolute():
-                current_base = Path(raw_base).resolve()
+        # One pass: a single stat per include item feeds both the counts and the patterns
+        file_count = 0
+        folder_count = 0
+        missing_files: List[str] = []
+        include_details: List[tuple[Path, bool]] = []
+
+        current_base_str = str(current_base)
+        for item in include_items:
+            full_str, mode = _stat_include_item(item, current_base_str)
+            is_dir = False
+            if mode is None:
+                missing_files.append(item)
+            elif stat.S_ISREG(mode):
+                file_count += 1
+            elif stat.S_ISDIR(mode):
+                folder_count += 1
+                is_dir = True
+            if verbose:
+                # Path objects are only needed for the tree view
+                include_details.append((Path(full_str), is_dir))
+
+            if full_str.startswith(root_prefix):
+                pattern = full_str[len(root_prefix):]
+            elif full_str == root_str:
+                pattern = "."
             else:
-                current_base = (sel_file.parent / raw_base).resolve()
-            
-            file_count, folder_count, missing_files = _count_files_and_folders(include_items, current_base)
-            
+                pattern = full_str
+            if os.sep != "/":
+                pattern = pattern.replace(os.sep, "/")
+
+            if is_dir:
+                pattern = f"{pattern}/**"
+
+            final_patterns[pattern] = None
+
+        if data.get("meta"):
             # Show warnings for missing files
             if missing_files:
-                console.print(f"[red]Warning: {len(missing_files)} file(s) from selection not found:[/red]")
-                for missing_file in missing_files:
-                    console.print(f"  [red]• {missing_file}[/red]")
-                console.print()  # Add spacing
+                warning = [f"[red]Warning: {len(missing_files)} file(s) from selection not found:[/red]"]
+                warning.extend(f"  [red]• {missing_file}[/red]" for missing_file in missing_files)
+                warning.append("")  # Add spacing
+                console.print("\n".join(warning))
             
             _print_metadata(
                 data["meta"],
@@ -454,40 +668,13 @@ def generate_repomix(
         else:
             _print_metadata({}, sel_file.name, absolute_path=sel_absolute_path)
 
-        raw_base = _ensure_content(data, "basePath", sel_file)
-        include_items = _ensure_content(data, "include", sel_file)
-
-        if Path(raw_base).is_absolute():
-            current_base = Path(raw_base).resolve()
-        else:
-            current_base = (sel_file.parent / raw_base).resolve()
-
         if verbose:
             console.print(f"[dim]Processing {sel_file} ({len(include_items)} entries)[/dim]")
 
-        include_details: List[tuple[Path, bool]] = []
-
-        for item in include_items:
-            path_obj = Path(item)
-            full_path = path_obj if path_obj.is_absolute() else (current_base / path_obj).resolve()
-            is_dir = full_path.exists() and full_path.is_dir()
-            include_details.append((full_path, is_dir))
-
-            try:
-                rel_path = full_path.relative_to(execution_root)
-                pattern = rel_path.as_posix()
-            except ValueError:
-                pattern = full_path.as_posix()
-
-            if is_dir:
-                pattern = f"{pattern}/**"
-
-            final_patterns.append(pattern)
-
         if verbose and include_details:
             _print_tree_view(include_details, execution_root)
 
-    unique_patterns = list(dict.fromkeys(final_patterns))
+    unique_patterns = list(final_patterns)
 
     if not unique_patterns:
         console.print("[yellow]Warning: No paths found in selections.[/yellow]")
@@ -499,11 +686,27 @@ def generate_repomix(
         console.print(f"[dim]Output target: {output}[/dim]")
 
     try:
-        # Generate XML using native implementation
-        xml_content = generator.generate_xml(execution_root, unique_patterns, verbose, compress)
+        # With --cache, reuse a previous result when no matched file has changed
+        cache_file = None
+        paths = None
+        if cache:
+            # Collect once; the fingerprint and a cache miss share the walk
+            paths = generator.collect(execution_root, unique_patterns)
+            key = generator.fingerprint(execution_root, unique_patterns, compress, paths)
+            cache_file = get_cache_dir() / "generate" / f"{key}.xml"
+
+        if cache_file is not None and cache_file.is_file():
+            xml_content = cache_file.read_text(encoding="utf-8")
+            if verbose:
+                console.print(f"[dim]Inputs unchanged, reusing cached output {cache_file.name}[/dim]")
+        else:
+            # Generate XML using native implementation
+            xml_content = generator.generate_xml(execution_root, unique_patterns, verbose, compress, paths)
+            if cache_file is not None:
+                _store_cached_output(cache_file, xml_content)
         
-        # Write to output file
-        output.write_text(xml_content, encoding="utf-8")
+        # Write to output file (atomically; unchanged output is left untouched)
+        write_text_atomic(output, xml_content)
         
         # Verify output file existence
         if not output.exists():
@@ -515,6 +718,8 @@ def generate_repomix(
         
         # Handle Clipboard Logic
         if copy:
+            from ..utils.clipboard import copy_file_uri_to_clipboard
+
             if copy_file_uri_to_clipboard(output):
                 console.print(f"[bold green]File URI copied to clipboard![/bold green]")
                 console.print(f"[dim](Ready to paste into Claude/ChatGPT upload dialog)[/dim]")
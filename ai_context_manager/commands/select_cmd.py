@@ -6,7 +6,6 @@ from pathlib import Path
 from typing import Dict, Set
 
 import typer
-import yaml
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container
@@ -14,6 +13,7 @@ from textual.events import Mount
 from textual.widgets import Button, DirectoryTree, Footer, Header, Input, Label
 
 from ..config import CLI_CONTEXT_SETTINGS
+from ..utils.file_utils import write_text_atomic
 from rich.text import Text
 
 app = typer.Typer(help="Interactive file selection TUI", context_settings=CLI_CONTEXT_SETTINGS)
@@ -112,6 +112,8 @@ class SelectionApp(App):
 
     def action_save_and_quit(self) -> None:
         """Save selection to YAML strictly adhering to the schema and exit."""
+        import yaml
+
         includes = []
 
         for path in self.tree_widget.selected_paths:
@@ -141,7 +143,7 @@ class SelectionApp(App):
         if self.output_file.exists():
             try:
                 with open(self.output_file, "r", encoding="utf-8") as f:
-                    existing = yaml.safe_load(f) or {}
+                    existing = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
             except Exception:
                 existing = {}
 
@@ -163,8 +165,10 @@ class SelectionApp(App):
             },
         }
 
-        with open(self.output_file, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, sort_keys=False)
+        write_text_atomic(
+            self.output_file,
+            yaml.dump(data, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper), sort_keys=False),
+        )
 
         self.exit(result=True)
 
@@ -180,9 +184,11 @@ def start(
     preselected: Dict | None = None
 
     if output.exists():
+        import yaml
+
         try:
             with open(output, "r") as f:
-                preselected = yaml.safe_load(f) or {}
+                preselected = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
         except Exception:
             preselected = None
 
@@ -364,6 +364,8 @@ TOKEN_ESTIMATION_RATIO = 0.75  # Rough estimate: 1 token ≈ 0.75 words
 CHARS_PER_TOKEN = 4  # Rough estimate: 1 token ≈ 4 characters
 
 # CLI configuration
+VERSION_BANNER = "AI Context Manager v0.2.0 (Visual Edition)"
+
 CLI_CONTEXT_SETTINGS = {
     "help_option_names": ["-h", "--help"],
     "max_content_width": 120,
@@ -411,4 +413,34 @@ def get_config_dir() -> Path:
     # Ensure the directory exists
     config_dir.mkdir(parents=True, exist_ok=True)
     
-    return config_dir
\ No newline at end of file
+    return config_dir
+
+
+@lru_cache(maxsize=1)
+def get_cache_dir() -> Path:
+    """Get the XDG-compliant cache directory for AI Context Manager.
+    
+    Returns:
+        Path: The absolute path to the cache directory, creating it if necessary.
+        
+    Platform-specific behavior:
+        - Linux/macOS: ~/.cache/ai-context-manager/
+        - Windows: %LOCALAPPDATA%/ai-context-manager/cache/
+        - If XDG_CACHE_HOME is set, uses that instead of ~/.cache/
+    """
+    import platform
+    
+    xdg_cache_home = os.getenv("XDG_CACHE_HOME")
+    
+    if xdg_cache_home:
+        cache_dir = Path(xdg_cache_home) / "ai-context-manager"
+    elif platform.system() == "Windows":
+        local_app_data = os.getenv("LOCALAPPDATA")
+        base = Path(local_app_data) if local_app_data else Path.home() / "AppData" / "Local"
+        cache_dir = base / "ai-context-manager" / "cache"
+    else:
+        cache_dir = Path.home() / ".cache" / "ai-context-manager"
+    
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    return cache_dir
@@ -1,14 +1,32 @@
 """Export functionality for AI Context Manager."""
 
 import json
-import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, Iterator, List, Tuple, Union
+from xml.sax.saxutils import escape
 import datetime
 
+try:  # Optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is used instead
+    orjson = None  # type: ignore
+
 from ai_context_manager.core.selection import Selection
-from ai_context_manager.utils.file_utils import get_file_info
-from ai_context_manager.utils.token_counter import count_tokens
+from ai_context_manager.utils.file_utils import fast_line_count
+from ai_context_manager.utils.token_counter import TokenCounter, count_tokens
+
+# Selections smaller than this are read sequentially; larger ones keep up to
+# _READ_AHEAD reads in flight while the current file is being written.
+_PARALLEL_READ_THRESHOLD = 32
+_READ_AHEAD = 16
+# The markdown writer issues many small writes; a large buffer turns them into
+# a handful of syscalls.
+_WRITE_BUFFER = 1 << 20
+# Attribute-only entities, on top of the &, < and > that escape() handles,
+# matching ElementTree's attribute serialization.
+_XML_ATTR_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#09;"}
 
 
 class ContextExporter:
@@ -39,23 +57,27 @@ class ContextExporter:
         # 2. Get summary information
         summary = self._get_summary(files)
         
-        # 3. Generate export content based on format
-        if format.lower() == "json":
-            content = self._export_json(files, summary)
-        elif format.lower() == "xml":
-            content = self._export_xml(files, summary)
-        elif format.lower() == "yaml":
-            content = self._export_yaml(files, summary)
-        else:  # markdown
-            content = self._export_markdown(files, summary)
-        
-        # 4. Write to file
+        # 3. Generate export content and write it to file
         try:
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(content, encoding='utf-8')
-            
-            # Count tokens in the exported content
-            total_tokens = count_tokens(content)
+            fmt = format.lower()
+            if fmt in ("json", "xml", "yaml"):
+                # Build the whole document first, so a failure here leaves an
+                # existing output file untouched
+                if fmt == "json":
+                    content = self._export_json(files, summary)
+                elif fmt == "xml":
+                    content = self._export_xml(files, summary)
+                else:
+                    content = self._export_yaml(files, summary)
+                # Count tokens in the exported content
+                total_tokens = count_tokens(content)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with output_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as handle:
+                    handle.write(content)
+            else:  # markdown, streamed straight to the file
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                with output_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as handle:
+                    total_tokens = self._write_markdown(handle.write, files, summary)
             
             return {
                 "success": True,
@@ -81,9 +103,13 @@ class ContextExporter:
         languages = {}
         
         for file_path in files:
-            info = get_file_info(file_path)
-            total_size += info["size"]
-            total_lines += info["lines"]
+            # Only size and line count are needed here; get_file_info would
+            # also probe binary/text/mime type, re-reading every file.
+            try:
+                total_size += file_path.stat().st_size
+            except OSError:
+                pass
+            total_lines += fast_line_count(file_path)
             
             ext = file_path.suffix.lower()
             if ext not in languages:
@@ -108,94 +134,160 @@ class ContextExporter:
             idx += 1
         return f"{size:.1f} {units[idx]}"
 
-    def _export_markdown(self, files: List[Path], summary: Dict[str, Any]) -> str:
-        lines = []
-        lines.append("# AI Context Export")
+    def _write_markdown(
+        self, write: Callable[[str], Any], files: List[Path], summary: Dict[str, Any]
+    ) -> int:
+        """Write the markdown export piece by piece; returns its token count.
+
+        Lines are emitted as they are produced instead of being joined into
+        one string, so peak memory stays around a single file's content.
+        """
+        tokens = TokenCounter()
+        first = True
+
+        def emit(line: str) -> None:
+            nonlocal first
+            if not first:
+                write("\n")
+                tokens.add("\n")
+            first = False
+            write(line)
+            tokens.add(line)
+
+        emit("# AI Context Export")
 
         meta = self.selection.meta
-        lines.append("## Metadata")
-        lines.append(f"- **Description**: {meta.description}")
-        lines.append(f"- **Type**: {meta.documentType}")
-        lines.append(f"- **Created**: {meta.createdAt} by {meta.createdBy}")
-        lines.append(f"- **Updated**: {meta.updatedAt} by {meta.updatedBy}")
+        emit("## Metadata")
+        emit(f"- **Description**: {meta.description}")
+        emit(f"- **Type**: {meta.documentType}")
+        emit(f"- **Created**: {meta.createdAt} by {meta.createdBy}")
+        emit(f"- **Updated**: {meta.updatedAt} by {meta.updatedBy}")
         if meta.tags:
-            lines.append(f"- **Tags**: {', '.join(meta.tags)}")
+            emit(f"- **Tags**: {', '.join(meta.tags)}")
         if meta.version:
-            lines.append(f"- **Version**: {meta.version}")
-        lines.append("")
-        lines.append("## Summary")
-        lines.append(f"- **Total Files**: {summary['total_files']}")
-        lines.append(f"- **Total Size**: {summary['total_size_human']}")
-        lines.append(f"Generated on: {datetime.datetime.now().isoformat()}")
-        lines.append("")
-        lines.append("## File Contents")
-        lines.append("")
+            emit(f"- **Version**: {meta.version}")
+        emit("")
+        emit("## Summary")
+        emit(f"- **Total Files**: {summary['total_files']}")
+        emit(f"- **Total Size**: {summary['total_size_human']}")
+        emit(f"Generated on: {datetime.datetime.now().isoformat()}")
+        emit("")
+        emit("## File Contents")
+        emit("")
         
-        for file_path in files:
+        for file_path, content in _iter_file_texts(files):
+            if isinstance(content, Exception):
+                emit(f"### {file_path} (Error: {content})")
+                emit("")
+                continue
+
             try:
-                try:
-                    display_path = file_path.relative_to(self.selection.base_path)
-                except ValueError:
-                    display_path = file_path
-
-                content = file_path.read_text(encoding='utf-8', errors='replace')
-                ext = file_path.suffix.lstrip('.') or 'txt'
-                
-                lines.append(f"### {display_path}")
-                lines.append(f"```{ext}")
-                lines.append(content)
-                lines.append("```")
-                lines.append("")
-            except Exception as e:
-                lines.append(f"### {file_path} (Error: {e})")
-                lines.append("")
-        return "\n".join(lines)
+                display_path = file_path.relative_to(self.selection.base_path)
+            except ValueError:
+                display_path = file_path
+            ext = file_path.suffix.lstrip('.') or 'txt'
+
+            emit(f"### {display_path}")
+            emit(f"```{ext}")
+            emit(content)
+            emit("```")
+            emit("")
+        return tokens.total
 
     def _export_json(self, files: List[Path], summary: Dict[str, Any]) -> str:
         export_data = {
             "metadata": {"generated_at": datetime.datetime.now().isoformat(), "summary": summary},
             "files": []
         }
-        for file_path in files:
+        for file_path, content in _iter_file_texts(files):
+            if isinstance(content, Exception):
+                export_data["files"].append({"path": str(file_path), "error": str(content)})
+                continue
             try:
-                try:
-                    rel_path = str(file_path.relative_to(self.selection.base_path))
-                except ValueError:
-                    rel_path = str(file_path)
-                content = file_path.read_text(encoding='utf-8', errors='replace')
-                export_data["files"].append({"path": rel_path, "content": content})
-            except Exception as e:
-                export_data["files"].append({"path": str(file_path), "error": str(e)})
-        return json.dumps(export_data, indent=2, ensure_ascii=False)
+                rel_path = str(file_path.relative_to(self.selection.base_path))
+            except ValueError:
+                rel_path = str(file_path)
+            export_data["files"].append({"path": rel_path, "content": content})
+        return _dumps_json(export_data)
 
     def _export_xml(self, files: List[Path], summary: Dict[str, Any]) -> str:
-        root = ET.Element("ai_context_export")
-        ET.SubElement(root, "metadata").text = datetime.datetime.now().isoformat()
-        files_elem = ET.SubElement(root, "files")
-        for file_path in files:
-            f_elem = ET.SubElement(files_elem, "file")
+        # Serialized by hand into a chunk list; the output matches what
+        # ElementTree.tostring produced without building the element tree.
+        chunks = ["<ai_context_export><metadata>", escape(datetime.datetime.now().isoformat()), "</metadata>"]
+        has_files = False
+        for file_path, content in _iter_file_texts(files):
+            if not has_files:
+                chunks.append("<files>")
+                has_files = True
             try:
-                try:
-                    rel_path = str(file_path.relative_to(self.selection.base_path))
-                except ValueError:
-                    rel_path = str(file_path)
-                f_elem.set("path", rel_path)
-                f_elem.text = file_path.read_text(encoding='utf-8', errors='replace')
-            except Exception as e:
-                f_elem.set("error", str(e))
-        return ET.tostring(root, encoding='unicode')
+                rel_path = str(file_path.relative_to(self.selection.base_path))
+            except ValueError:
+                rel_path = str(file_path)
+            chunks.append(f'<file path="{escape(rel_path, _XML_ATTR_ENTITIES)}"')
+            if isinstance(content, Exception):
+                chunks.append(f' error="{escape(str(content), _XML_ATTR_ENTITIES)}" />')
+            elif content:
+                chunks.extend((">", escape(content), "</file>"))
+            else:
+                chunks.append(" />")
+        chunks.append("</files></ai_context_export>" if has_files else "<files /></ai_context_export>")
+        return "".join(chunks)
 
     def _export_yaml(self, files: List[Path], summary: Dict[str, Any]) -> str:
         import yaml
         data = {"metadata": {"generated": datetime.datetime.now().isoformat()}, "files": []}
-        for file_path in files:
+        for file_path, content in _iter_file_texts(files):
+            if isinstance(content, Exception):
+                continue
             try:
-                try:
-                    rel_path = str(file_path.relative_to(self.selection.base_path))
-                except ValueError:
-                    rel_path = str(file_path)
-                content = file_path.read_text(encoding='utf-8', errors='replace')
-                data["files"].append({"path": rel_path, "content": content})
-            except Exception:
-                pass
-        return yaml.dump(data, sort_keys=False)
\ No newline at end of file
+                rel_path = str(file_path.relative_to(self.selection.base_path))
+            except ValueError:
+                rel_path = str(file_path)
+            data["files"].append({"path": rel_path, "content": content})
+        return yaml.dump(data, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper), sort_keys=False)
+
+
+def _read_text(file_path: Path) -> Union[str, Exception]:
+    """Read a file for export, returning the error instead of raising it."""
+    try:
+        return file_path.read_text(encoding='utf-8', errors='replace')
+    except Exception as e:
+        return e
+
+
+def _iter_file_texts(files: List[Path]) -> Iterator[Tuple[Path, Union[str, Exception]]]:
+    """
+    Yield (path, text or read error) in order.
+
+    Large selections are read ahead on a small thread pool so disk latency
+    overlaps with rendering, while only a bounded window of contents is held
+    in memory at once.
+    """
+    if len(files) < _PARALLEL_READ_THRESHOLD:
+        for file_path in files:
+            yield file_path, _read_text(file_path)
+        return
+
+    with ThreadPoolExecutor(max_workers=_READ_AHEAD) as executor:
+        remaining = iter(files)
+        pending = deque(
+            (file_path, executor.submit(_read_text, file_path))
+            for _, file_path in zip(range(_READ_AHEAD), remaining)
+        )
+        while pending:
+            file_path, future = pending.popleft()
+            next_path = next(remaining, None)
+            if next_path is not None:
+                pending.append((next_path, executor.submit(_read_text, next_path)))
+            yield file_path, future.result()
+
+
+def _dumps_json(data: Dict[str, Any]) -> str:
+    """Serialize export data as indented JSON, via orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            # e.g. surrogate-escaped file names; let the stdlib handle them
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
@@ -1,11 +1,12 @@
 """Content transformation for compression and optimization."""
 import ast
-import re
 from pathlib import Path
 from typing import Optional
 
 from .models import TransformOptions
 
+_COMMENT_PREFIXES = ("#", "//", "/*", "*")
+
 
 class ContentTransformer:
     """Transforms content for compression and optimization."""
@@ -78,11 +79,11 @@ class ContentTransformer:
                 continue
             
             # Skip common comment patterns
-            if stripped.startswith("#") or stripped.startswith("//") or stripped.startswith("/*") or stripped.startswith("*") or stripped.startswith("*/"):
+            if stripped.startswith(_COMMENT_PREFIXES):
                 continue
             
             # Remove excessive whitespace within lines
-            compressed_line = re.sub(r"\s+", " ", stripped)
+            compressed_line = " ".join(stripped.split())
             compressed_lines.append(compressed_line)
         
         return "\n".join(compressed_lines)
@@ -1,47 +1,70 @@
 """File loading and collection for native context generation."""
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
+
+from ai_context_manager.utils.file_utils import iter_files
 
 from .models import ContextFile
 
+# Below this many files the thread pool costs more than it saves.
+_PARALLEL_READ_THRESHOLD = 32
+
 
 class FileLoader:
     """Loads and collects files based on include patterns."""
     
-    def load(self, execution_root: Path, include_patterns: List[str]) -> List[ContextFile]:
-        """Load files matching the include patterns."""
-        files = []
+    def collect(self, execution_root: Path, include_patterns: List[str]) -> Dict[str, Path]:
+        """Map each file matched by the include patterns to its relative path."""
+        # Collect unique paths first so overlapping patterns (e.g. "src/**"
+        # and "src/app.py") don't read the same file more than once.
+        paths = {}
         
         for pattern in include_patterns:
             # Handle directory patterns (ending with /**)
             if pattern.endswith("/**"):
                 dir_path = execution_root / pattern[:-3]
                 if dir_path.exists() and dir_path.is_dir():
-                    for file_path in dir_path.rglob("*"):
-                        if file_path.is_file():
-                            rel_path = file_path.relative_to(execution_root)
-                            content = self._read_file_safely(file_path)
-                            if content is not None:
-                                files.append(ContextFile(
-                                    path=str(rel_path),
-                                    content=content
-                                ))
+                    for file_str in iter_files(dir_path):
+                        rel_path = os.path.relpath(file_str, execution_root)
+                        if rel_path not in paths:
+                            paths[rel_path] = Path(file_str)
             else:
                 # Handle specific file patterns
                 file_path = execution_root / pattern
                 if file_path.exists() and file_path.is_file():
-                    rel_path = file_path.relative_to(execution_root)
-                    content = self._read_file_safely(file_path)
-                    if content is not None:
-                        files.append(ContextFile(
-                            path=str(rel_path),
-                            content=content
-                        ))
+                    rel_path = str(file_path.relative_to(execution_root))
+                    paths.setdefault(rel_path, file_path)
+        
+        return paths
+    
+    def load(
+        self,
+        execution_root: Path,
+        include_patterns: List[str],
+        paths: Optional[Dict[str, Path]] = None
+    ) -> List[ContextFile]:
+        """Load files matching the include patterns, or the already collected paths."""
+        if paths is None:
+            paths = self.collect(execution_root, include_patterns)
+        
+        # Read each file once, sorted by path. Reads are I/O bound, so larger
+        # selections overlap them on a thread pool.
+        rel_paths = sorted(paths)
+        file_paths = [paths[rel_path] for rel_path in rel_paths]
+        if len(file_paths) >= _PARALLEL_READ_THRESHOLD:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                contents = list(executor.map(self._read_file_safely, file_paths))
+        else:
+            contents = [self._read_file_safely(file_path) for file_path in file_paths]
         
-        # Remove duplicates and sort by path
-        unique_files = {f.path: f for f in files}
-        return [unique_files[path] for path in sorted(unique_files.keys())]
+        return [
+            ContextFile(path=rel_path, content=content)
+            for rel_path, content in zip(rel_paths, contents)
+            if content is not None
+        ]
     
     def _read_file_safely(self, file_path: Path) -> str | None:
         """Safely read file content with proper encoding handling."""
@@ -1,7 +1,9 @@
 """Native context generator orchestrator."""
+import hashlib
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional
 
 from .content_transform import ContentTransformer
 from .file_loader import FileLoader
@@ -9,6 +11,15 @@ from .models import ContextFile, ContextRenderInput, TransformOptions
 from .xml_renderer import XmlContextRenderer
 
 
+@lru_cache(maxsize=1)
+def _implementation_digest() -> str:
+    """Digest of this package's source, so any change to how output is built invalidates cached outputs."""
+    digest = hashlib.blake2b(digest_size=8)
+    for module_path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(module_path.read_bytes())
+    return digest.hexdigest()
+
+
 class NativeContextGenerator:
     """Orchestrates native context generation."""
     
@@ -22,13 +33,19 @@ class NativeContextGenerator:
         execution_root: Path,
         include_patterns: List[str],
         verbose: bool = False,
-        compress: bool = False
+        compress: bool = False,
+        paths: Optional[Dict[str, Path]] = None
     ) -> str:
-        """Generate XML context from include patterns."""
+        """
+        Generate XML context from include patterns.
+        
+        Pass the mapping from collect() as paths to skip walking the include
+        set again.
+        """
         if verbose:
             print(f"Loading files from {execution_root} with patterns: {include_patterns}")
         
-        files = self._loader.load(execution_root, include_patterns)
+        files = self._loader.load(execution_root, include_patterns, paths)
         
         if verbose:
             print(f"Loaded {len(files)} files")
@@ -62,18 +79,57 @@ class NativeContextGenerator:
         
         return self._renderer.render(payload)
     
+    def collect(self, execution_root: Path, include_patterns: List[str]) -> Dict[str, Path]:
+        """Map each file matched by the include patterns to its relative path."""
+        return self._loader.collect(execution_root, include_patterns)
+    
+    def fingerprint(
+        self,
+        execution_root: Path,
+        include_patterns: List[str],
+        compress: bool = False,
+        paths: Optional[Dict[str, Path]] = None
+    ) -> str:
+        """
+        Digest of everything generate_xml's output depends on.
+        
+        Covers this package's source, the root, the compress flag and every
+        matched file's relative path, size, mtime, ctime and inode, so
+        unchanged inputs give the same key without reading any file contents.
+        An edit that keeps all of those stats (e.g. a same-size rewrite on a
+        filesystem with coarse timestamps) is not detected, which is why the
+        output cache is opt-in.
+        """
+        if paths is None:
+            paths = self.collect(execution_root, include_patterns)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{_implementation_digest()}\0{execution_root}\0{compress}\0".encode("utf-8", "surrogateescape"))
+        for rel_path, file_path in sorted(paths.items()):
+            try:
+                st = file_path.stat()
+                meta = f"{st.st_size}:{st.st_mtime_ns}:{st.st_ctime_ns}:{st.st_ino}"
+            except OSError:
+                meta = "-"
+            digest.update(f"{rel_path}\0{meta}\n".encode("utf-8", "surrogateescape"))
+        return digest.hexdigest()
+    
     def _build_tree_string(self, execution_root: Path, files: List[ContextFile]) -> str:
         """Build a directory tree representation."""
         if not files:
             return "No files found"
         
-        # Build directory structure
-        dirs = set()
+        # Derive each file's string form, name and parts once; both passes
+        # below reuse them instead of rebuilding Path objects.
+        entries = []
         for file in files:
             file_path = Path(file.path)
-            parts = file_path.parts
+            entries.append((str(file_path), file_path.name, file_path.parts))
+        
+        # Build directory structure
+        dirs = set()
+        for _, name, parts in entries:
             for i in range(len(parts)):
-                dirs.add("/".join(parts[:i+1]) if parts[i] != file_path.name else file_path.name)
+                dirs.add("/".join(parts[:i+1]) if parts[i] != name else name)
         
         # Sort directories for consistent output
         sorted_dirs = sorted(dirs)
@@ -89,13 +145,11 @@ class NativeContextGenerator:
                 lines.append(f"├── {dir_path}")
         
         # Add files
-        for file in files:
-            file_path = Path(file.path)
-            if "/" in str(file_path):
-                indent = "  " * (str(file_path).count("/") - 1)
-                name = file_path.name
+        for path_str, name, _ in entries:
+            if "/" in path_str:
+                indent = "  " * (path_str.count("/") - 1)
                 lines.append(f"{indent}├── {name}")
             else:
-                lines.append(f"├── {file_path.name}")
+                lines.append(f"├── {name}")
         
         return "\n".join(lines)
@@ -1,7 +1,4 @@
 """XML renderer for Repomix-compatible output."""
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
-
 from .models import ContextRenderInput
 
 
@@ -9,24 +6,46 @@ class XmlContextRenderer:
     """Renders context as Repomix-compatible XML."""
     
     def render(self, payload: ContextRenderInput) -> str:
-        """Render the context payload to XML string."""
-        root = ET.Element("repomix")
+        """
+        Render the context payload to XML string.
+        
+        Produces the same pretty-printed layout the ElementTree + minidom
+        round trip did, without building a tree, serializing it and parsing
+        it back into a DOM.
+        """
+        if not (payload.include_summary or payload.include_tree or payload.include_files):
+            return "<repomix/>\n"
+        
+        parts = ["<repomix>\n"]
         
         if payload.include_summary:
-            summary = ET.SubElement(root, "file_summary")
-            summary.text = payload.generation_header
+            parts.append(_element("  ", "file_summary", payload.generation_header))
         
         if payload.include_tree:
-            tree = ET.SubElement(root, "directory_structure")
-            tree.text = payload.tree_string
+            parts.append(_element("  ", "directory_structure", payload.tree_string))
         
         if payload.include_files:
-            files_el = ET.SubElement(root, "files")
-            for item in payload.files:
-                node = ET.SubElement(files_el, "file", {"path": item.path})
-                node.text = item.content
+            if not payload.files:
+                parts.append("  <files/>\n")
+            else:
+                parts.append("  <files>\n")
+                for item in payload.files:
+                    parts.append(_element("    ", "file", item.content, f' path="{_escape(item.path)}"'))
+                parts.append("  </files>\n")
         
-        # Convert to pretty-printed XML
-        rough_string = ET.tostring(root, encoding="unicode")
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="  ")[23:]  # Remove XML declaration
+        parts.append("</repomix>\n")
+        return "".join(parts)
+
+
+def _escape(data: str) -> str:
+    """Escape text the way minidom writes it."""
+    return data.replace("&", "&amp;").replace("<", "&lt;").replace('"', "&quot;").replace(">", "&gt;")
+
+
+def _element(indent: str, tag: str, text: str, attrs: str = "") -> str:
+    """Render a single text-only element on its own line."""
+    if not text:
+        return f"{indent}<{tag}{attrs}/>\n"
+    # An XML parser normalizes line endings in character data; keep doing so.
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return f"{indent}<{tag}{attrs}>{_escape(text)}</{tag}>\n"
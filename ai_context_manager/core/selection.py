@@ -2,16 +2,32 @@
 Strict data model for handling file selections via JSON Schema.
 """
 import json
+import os
+import stat
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 
 import jsonschema
-import yaml
+
+from ai_context_manager.utils.file_utils import iter_files
 
 SCHEMA_PATH = Path(__file__).parent.parent / "schemas" / "context-definition.schema.json"
 
 
+@lru_cache(maxsize=1)
+def _schema_validator() -> Any:
+    """Load the schema and build its validator once per process."""
+    if not SCHEMA_PATH.exists():
+        raise RuntimeError("Internal Error: Schema definition file missing.")
+
+    schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 @dataclass
 class SelectionMeta:
     description: str
@@ -36,17 +52,17 @@ class Selection:
         """
         Load selection from a YAML file with strict Schema validation.
         No legacy support.
-        """
-        if not yaml_path.exists():
-            raise FileNotFoundError(f"Selection file not found: {yaml_path}")
 
+        The parsed and validated YAML is cached per file until its mtime or
+        size changes; every call still returns a new Selection.
+        """
         try:
-            with open(yaml_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
-        except Exception as exc:
-            raise ValueError(f"Failed to parse YAML: {exc}") from exc
+            st = yaml_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Selection file not found: {yaml_path}") from None
 
-        cls._validate_schema(data)
+        yaml_path = yaml_path.absolute()
+        data = cls._load_cached(yaml_path, st.st_mtime_ns, st.st_size)
 
         content = data["content"]
         raw_base = content["basePath"]
@@ -66,23 +82,37 @@ class Selection:
             updatedAt=meta_dict["updatedAt"],
             updatedBy=meta_dict["updatedBy"],
             documentType=meta_dict["documentType"],
-            tags=meta_dict.get("tags", []),
-            relatedTags=meta_dict.get("relatedTags", []),
+            tags=list(meta_dict.get("tags", [])),
+            relatedTags=list(meta_dict.get("relatedTags", [])),
             version=meta_dict.get("version"),
         )
 
         return cls(base_path=base, include_paths=include_paths, meta=meta)
 
     @staticmethod
-    def _validate_schema(data: Dict[str, Any]) -> None:
-        """Validate data against the JSON schema."""
-        if not SCHEMA_PATH.exists():
-            raise RuntimeError("Internal Error: Schema definition file missing.")
+    @lru_cache(maxsize=8)
+    def _load_cached(yaml_path: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """Parse and validate a selection file; cache key includes mtime and size."""
+        import yaml
 
-        schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
         try:
-            jsonschema.validate(instance=data, schema=schema)
-        except jsonschema.ValidationError as exc:
+            # Hand libyaml raw bytes in one read; it detects the encoding
+            # itself instead of pulling decoded chunks through a text stream.
+            raw = yaml_path.read_bytes()
+            data = yaml.load(raw, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
+        except Exception as exc:
+            raise ValueError(f"Failed to parse YAML: {exc}") from exc
+
+        Selection._validate_schema(data)
+        return data
+
+    @staticmethod
+    def _validate_schema(data: Dict[str, Any]) -> None:
+        """Validate data against the JSON schema."""
+        # Same error selection as jsonschema.validate, minus re-reading and
+        # re-checking the schema on every load.
+        exc = jsonschema.exceptions.best_match(_schema_validator().iter_errors(data))
+        if exc is not None:
             path = " -> ".join(str(p) for p in exc.path) if exc.path else "root"
             raise ValueError(f"Schema Validation Error at '{path}': {exc.message}") from exc
 
@@ -91,17 +121,18 @@ class Selection:
         Flatten the selection into a distinct list of files.
         Checks filesystem to determine if a path is a file or directory.
         """
-        final_list: List[Path] = []
+        final_files: Set[Path] = set()
 
         for path in self.include_paths:
-            if not path.exists():
+            # One stat per include instead of exists() + is_file() + is_dir()
+            try:
+                mode = os.stat(path).st_mode
+            except OSError:
                 continue
 
-            if path.is_file():
-                final_list.append(path)
-            elif path.is_dir():
-                for file_path in path.rglob("*"):
-                    if file_path.is_file():
-                        final_list.append(file_path)
+            if stat.S_ISREG(mode):
+                final_files.add(path)
+            elif stat.S_ISDIR(mode):
+                final_files.update(Path(file_path) for file_path in iter_files(path))
 
-        return sorted(list(set(final_list)))
+        return sorted(final_files)
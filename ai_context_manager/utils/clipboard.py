@@ -1,14 +1,33 @@
 """Clipboard utilities for AI Context Manager."""
+import os
 import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from rich.console import Console
+from typing import Optional
+
+_console = None
+
+
+def get_console():
+    """Return the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+@lru_cache(maxsize=8)
+def _which(command: str, search_path: str) -> Optional[str]:
+    """shutil.which, memoized; search_path is the current $PATH and only keys the cache."""
+    return shutil.which(command)
 
-console = Console()
 
 def is_xclip_installed() -> bool:
     """Check if xclip is available on the system."""
-    return shutil.which("xclip") is not None
+    return _which("xclip", os.environ.get("PATH", "")) is not None
 
 def copy_file_uri_to_clipboard(file_path: Path) -> bool:
     """
@@ -16,12 +35,12 @@ def copy_file_uri_to_clipboard(file_path: Path) -> bool:
     Target format is text/uri-list for file uploads.
     """
     if not is_xclip_installed():
-        console.print("[red]Error: 'xclip' is not installed. Please install it to use the --copy feature.[/red]")
+        get_console().print("[red]Error: 'xclip' is not installed. Please install it to use the --copy feature.[/red]")
         return False
 
     abs_path = file_path.resolve()
     if not abs_path.exists():
-        console.print(f"[red]Error: File not found at {abs_path}[/red]")
+        get_console().print(f"[red]Error: File not found at {abs_path}[/red]")
         return False
 
     # Construct URI (file:///absolute/path)
@@ -32,9 +51,10 @@ def copy_file_uri_to_clipboard(file_path: Path) -> bool:
         subprocess.run(
             ["xclip", "-selection", "clipboard", "-t", "text/uri-list"],
             input=file_uri.encode("utf-8"),
+            stdout=subprocess.DEVNULL,
             check=True
         )
         return True
     except subprocess.CalledProcessError as e:
-        console.print(f"[red]Failed to copy to clipboard: {e}[/red]")
+        get_console().print(f"[red]Failed to copy to clipboard: {e}[/red]")
         return False
@@ -1,8 +1,14 @@
 """File utilities for AI Context Manager."""
+import codecs
 import fnmatch
 import mimetypes
+import os
+import re
+import stat
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Callable, Iterator, List, Optional, Set, Tuple
 
 
 def is_binary_file(file_path: Path) -> bool:
@@ -26,13 +32,82 @@ def get_file_mime_type(file_path: Path) -> str:
     return mime_type or "application/octet-stream"
 
 
+_GLOB_CHARS = frozenset("*?[")
+
+
+@lru_cache(maxsize=128)
+def _compile_patterns(
+    patterns: Tuple[str, ...]
+) -> Tuple[Tuple[str, ...], frozenset, Optional["re.Pattern[str]"]]:
+    """Split glob patterns into suffix checks, literal names and one combined regex.
+
+    ``*.ext``-style patterns become plain ``str.endswith`` suffixes and patterns
+    without wildcards become set lookups; only the rest go through a regex.
+    The result is cached per pattern set.
+    """
+    suffixes: List[str] = []
+    literals: Set[str] = set()
+    globs: List[str] = []
+    for pattern in patterns:
+        pattern = os.path.normcase(pattern)
+        if pattern.startswith("*") and _GLOB_CHARS.isdisjoint(pattern[1:]):
+            suffixes.append(pattern[1:])
+        elif _GLOB_CHARS.isdisjoint(pattern):
+            literals.add(pattern)
+        else:
+            globs.append(pattern)
+    regex = re.compile("|".join(fnmatch.translate(p) for p in globs)) if globs else None
+    return tuple(suffixes), frozenset(literals), regex
+
+
 def matches_pattern(file_path: Path, patterns: List[str]) -> bool:
     """Check if a file path matches any of the given patterns."""
-    path_str = str(file_path)
-    for pattern in patterns:
-        if fnmatch.fnmatch(path_str, pattern) or fnmatch.fnmatch(file_path.name, pattern):
-            return True
-    return False
+    if not patterns:
+        return False
+    suffixes, literals, regex = _compile_patterns(tuple(patterns))
+    path_str = os.path.normcase(str(file_path))
+    name = os.path.normcase(file_path.name)
+    if suffixes and path_str.endswith(suffixes):
+        return True
+    if literals and (path_str in literals or name in literals):
+        return True
+    return bool(regex and (regex.match(path_str) or regex.match(name)))
+
+
+@lru_cache(maxsize=128)
+def _compile_dir_prune(patterns: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """Combined regex of the directory globs G in ``G/*`` patterns.
+
+    ``*`` also matches ``/``, so once a directory's path fully matches G every
+    file below it matches ``G/*``; such directories can be skipped unwalked.
+    """
+    globs = [os.path.normcase(p)[:-2] for p in patterns if p.endswith("/*") and len(p) > 2]
+    return re.compile("|".join(fnmatch.translate(g) for g in globs)) if globs else None
+
+
+def iter_files(
+    root: Path, recursive: bool = True, skip_dir: Optional[Callable[[str], bool]] = None
+) -> Iterator[str]:
+    """Yield the paths of regular files under root.
+
+    Uses an explicit os.scandir stack so file/dir checks reuse the stat data
+    cached on each DirEntry. Symlinked files are yielded, symlinked
+    directories are not descended into (same as Path.rglob). Directories for
+    which skip_dir(path) is true are not descended into either.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive and not (skip_dir and skip_dir(entry.path)):
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
 
 
 def collect_files(
@@ -50,17 +125,20 @@ def collect_files(
     
     files = []
     
+    # Directories whose every file an exclude pattern would reject are pruned
+    prune = _compile_dir_prune(tuple(exclude_patterns))
+    skip_dir = (lambda path: prune.match(os.path.normcase(path)) is not None) if prune else None
+    
     try:
-        for file_path in root_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-            
-            # Check file size
+        for path_str in iter_files(root_path, skip_dir=skip_dir):
+            # iter_files only yields regular files; one stat gives the size
             try:
-                if file_path.stat().st_size > max_file_size:
-                    continue
+                st = os.stat(path_str)
             except (OSError, IOError):
                 continue
+            if not stat.S_ISREG(st.st_mode) or st.st_size > max_file_size:
+                continue
+            file_path = Path(path_str)
             
             # Check exclude patterns
             if exclude_patterns and matches_pattern(file_path, exclude_patterns):
@@ -85,40 +163,142 @@ def collect_files(
 
 def read_file_content(file_path: Path, max_chars: int = None) -> str:
     """Read the content of a text file."""
+    # One read serves both the binary probe and the decode; newlines are
+    # normalized afterwards the same way text mode would. With max_chars the
+    # file is read in chunks only until that many characters are decoded.
     try:
-        # Return empty for binary files to avoid decoding issues
-        if is_binary_file(file_path):
-            return ""
-        with file_path.open('r', encoding='utf-8', errors='ignore') as f:
-            if max_chars:
-                return f.read(max_chars)
-            return f.read()
-    except (IOError, OSError, UnicodeDecodeError):
+        with open(file_path, 'rb') as handle:
+            if not max_chars:
+                data = handle.read()
+                # Return empty for binary files to avoid decoding issues
+                if b'\0' in data[:1024]:
+                    return ""
+                return _normalize_newlines(data.decode('utf-8', errors='ignore'))
+
+            # A UTF-8 character is at most 4 bytes, so one chunk is usually
+            # enough; more are read only when invalid bytes were dropped
+            chunk_size = max(max_chars * 4, 1024)
+            data = handle.read(chunk_size)
+            if b'\0' in data[:1024]:
+                return ""
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+            pieces = []
+            while True:
+                pieces.append(decoder.decode(data, final=not data))
+                text = _normalize_newlines(''.join(pieces))
+                if not data or len(text) >= max_chars:
+                    return text[:max_chars]
+                data = handle.read(chunk_size)
+    except (IOError, OSError):
         return ""
 
 
-def get_file_size(file_path: Path) -> int:
-    """Get file size in bytes; return 0 if file doesn't exist or is inaccessible."""
+def _normalize_newlines(text: str) -> str:
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+# Line boundaries str.splitlines() honours besides \n and \r, as UTF-8 bytes:
+# \v, \f, \x1c-\x1e, NEL (U+0085), LINE and PARAGRAPH SEPARATOR (U+2028/9)
+_EXTRA_LINE_BREAKS = (
+    b'\x0b', b'\x0c', b'\x1c', b'\x1d', b'\x1e', b'\xc2\x85', b'\xe2\x80\xa8', b'\xe2\x80\xa9',
+)
+
+
+def fast_line_count(file_path: Path) -> int:
+    """Count lines by scanning raw bytes instead of decoding the file.
+
+    Agrees with ``len(read_file_content(path).splitlines())``, counting every
+    line boundary splitlines() recognizes; binary and unreadable files count
+    as 0.
+    """
     try:
-        return file_path.stat().st_size
+        data = file_path.read_bytes()
     except (OSError, IOError):
         return 0
+    if not data or b'\0' in data[:1024]:
+        return 0
+    lines = data.count(b'\n') + data.count(b'\r') - data.count(b'\r\n')
+    for separator in _EXTRA_LINE_BREAKS:
+        lines += data.count(separator)
+    if not data.endswith((b'\n', b'\r') + _EXTRA_LINE_BREAKS):
+        lines += 1
+    return lines
 
 
-def get_file_size(file_path: Path) -> int:
-    """Get file size in bytes."""
+def _current_umask() -> int:
+    """Return the process umask (os.umask can only be read by setting it)."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def write_text_atomic(file_path: Path, content: str, encoding: str = "utf-8") -> bool:
+    """Write text via a temp file and os.replace, skipping identical content.
+
+    Symlinks are written through to their target, and an existing file keeps
+    its permission bits. Targets that are not regular files (devices such as
+    /dev/stdout, FIFOs) or whose directory refuses a temp file are written
+    directly instead.
+
+    Returns True if the file was (re)written, False if it already held content.
+    """
+    data = content.encode(encoding)
+    target = Path(os.path.realpath(file_path))
     try:
-        return file_path.stat().st_size
-    except (OSError, IOError):
-        return 0
+        st = target.stat()
+    except OSError:
+        st = None
+
+    if st is not None:
+        if not stat.S_ISREG(st.st_mode):
+            _write_bytes_direct(target, data)
+            return True
+        try:
+            if st.st_size == len(data) and target.read_bytes() == data:
+                return False
+        except OSError:
+            pass
+
+    try:
+        fd, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    except PermissionError:
+        if st is None:
+            raise
+        # The file is writable but its directory is not; keep the old behaviour
+        _write_bytes_direct(target, data)
+        return True
+
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        # mkstemp creates 0600; match the old file, or what open() would create
+        mode = stat.S_IMODE(st.st_mode) if st is not None else 0o666 & ~_current_umask()
+        os.chmod(temp_name, mode)
+        os.replace(temp_name, target)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def _write_bytes_direct(target: Path, data: bytes) -> None:
+    with open(target, "wb") as handle:
+        handle.write(data)
+
 
 def get_file_size(file_path: Path) -> int:
-    """Get file size in bytes."""
+    """Get file size in bytes; return 0 if file doesn't exist or is inaccessible."""
     try:
         return file_path.stat().st_size
     except (OSError, IOError):
         return 0
 
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
     if size_bytes == 0:
@@ -139,22 +319,30 @@ def format_file_size(size_bytes: int) -> str:
 
 
 def get_file_info(file_path: Path) -> dict:
-    """Get comprehensive file information."""
+    """Get comprehensive file information.
+
+    The file is opened once; the binary check and line count both come from
+    that single read.
+    """
     try:
-        stat = file_path.stat()
-        content = read_file_content(file_path)
-        lines = len(content.splitlines()) if content is not None else 0
+        st = file_path.stat()
+        try:
+            data = file_path.read_bytes()
+        except (OSError, IOError):
+            data = None
+        is_binary = data is None or b'\0' in data[:1024]
+        lines = 0 if is_binary else len(data.decode('utf-8', errors='ignore').splitlines())
         
         return {
             "path": str(file_path),
             "name": file_path.name,
             "extension": file_path.suffix,
-            "size": stat.st_size,
-            "size_human": format_file_size(stat.st_size),
-            "modified": stat.st_mtime,
-            "created": stat.st_ctime,
-            "is_binary": is_binary_file(file_path),
-            "is_text": is_text_file(file_path),
+            "size": st.st_size,
+            "size_human": format_file_size(st.st_size),
+            "modified": st.st_mtime,
+            "created": st.st_ctime,
+            "is_binary": is_binary,
+            "is_text": not is_binary,
             "mime_type": get_file_mime_type(file_path),
             "lines": lines,
             "exists": True,
@@ -176,17 +364,22 @@ def get_file_info(file_path: Path) -> dict:
         }
 
 
-def get_language_from_extension(file_path: Path) -> str:
-    """Determine programming language from file extension."""
-    extension = file_path.suffix.lower()
-    
+@lru_cache(maxsize=1)
+def _extension_languages() -> dict:
+    """Invert LANGUAGE_EXTENSIONS once into an extension -> language map."""
     from ai_context_manager.config import LANGUAGE_EXTENSIONS
     
+    mapping = {}
     for language, extensions in LANGUAGE_EXTENSIONS.items():
-        if extension in extensions:
-            return language
-    
-    return "unknown"
+        for extension in extensions:
+            # First language listing an extension wins, as in a linear scan
+            mapping.setdefault(extension, language)
+    return mapping
+
+
+def get_language_from_extension(file_path: Path) -> str:
+    """Determine programming language from file extension."""
+    return _extension_languages().get(file_path.suffix.lower(), "unknown")
 
 
 def should_include_file(
@@ -198,12 +391,9 @@ def should_include_file(
 ) -> bool:
     """Determine if a file should be included based on all criteria."""
     try:
-        # Check if file exists and is readable
-        if not file_path.exists() or not file_path.is_file():
-            return False
-        
-        # Check file size
-        if file_path.stat().st_size > max_file_size:
+        # A single stat covers existence, file type and size
+        st = file_path.stat()
+        if not stat.S_ISREG(st.st_mode) or st.st_size > max_file_size:
             return False
         
         # Check exclude patterns
@@ -230,19 +420,14 @@ def get_project_structure(root_path: Path, max_depth: int = 3) -> List[Tuple[str
     """Get project directory structure up to a certain depth."""
     structure = []
     
+    root_str = str(root_path)
     try:
-        for path in root_path.rglob("*"):
-            if not path.is_file():
-                continue
+        for path_str in iter_files(root_path):
+            relative_path = os.path.relpath(path_str, root_str)
+            depth = relative_path.count(os.sep)
             
-            try:
-                relative_path = path.relative_to(root_path)
-                depth = len(relative_path.parts) - 1
-                
-                if depth <= max_depth:
-                    structure.append((str(relative_path), depth))
-            except ValueError:
-                continue
+            if depth <= max_depth:
+                structure.append((relative_path, depth))
     
     except (OSError, IOError):
         pass
@@ -260,15 +445,8 @@ def filter_files_by_language(
     
     from ai_context_manager.config import LANGUAGE_EXTENSIONS
     
-    filtered_files = []
-    for file_path in files:
-        extension = file_path.suffix.lower()
-        for language in languages:
-            if extension in LANGUAGE_EXTENSIONS.get(language, []):
-                filtered_files.append(file_path)
-                break
-    
-    return filtered_files
+    allowed = {ext for language in languages for ext in LANGUAGE_EXTENSIONS.get(language, [])}
+    return [file_path for file_path in files if file_path.suffix.lower() in allowed]
 
 
 def filter_files_by_patterns(
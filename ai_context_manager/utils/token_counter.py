@@ -1,7 +1,22 @@
 """Token counting utilities for AI Context Manager."""
 
+import hashlib
 import re
-from typing import Optional
+from typing import Dict, Optional
+
+_WORD_RE = re.compile(r'\b\w+\b')
+_CODE_INDICATOR_RES = (
+    re.compile(r'\b(def|function|class|import|from|const|let|var)\b'),
+    re.compile(r'[{}()\[\];]'),
+    re.compile(r'//|/\*|#|"""|\'\'\''),
+    re.compile(r'\b(if|else|for|while|return|try|catch)\b'),
+)
+
+# Estimates for large texts are memoized by content digest; hashing is far
+# cheaper than the regex passes, and exports often repeat identical files.
+_CACHE_MIN_CHARS = 4096
+_MAX_CACHED_COUNTS = 1024
+_token_cache: Dict[bytes, int] = {}
 
 
 def count_tokens(text: str, model: str = "gpt-4") -> int:
@@ -22,18 +37,30 @@ def count_tokens(text: str, model: str = "gpt-4") -> int:
     if not text:
         return 0
     
+    if len(text) < _CACHE_MIN_CHARS:
+        return _estimate(len(text), len(_WORD_RE.findall(text)), _is_likely_code(text))
+    
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    tokens = _token_cache.get(key)
+    if tokens is None:
+        tokens = _estimate(len(text), len(_WORD_RE.findall(text)), _is_likely_code(text))
+        if len(_token_cache) >= _MAX_CACHED_COUNTS:
+            _token_cache.pop(next(iter(_token_cache)))
+        _token_cache[key] = tokens
+    return tokens
+
+
+def _estimate(char_count: int, word_count: int, is_code: bool) -> int:
+    """Combine character and word counts into a token estimate."""
     # Simple approximation: 1 token ≈ 4 characters
-    char_count = len(text)
     token_estimate = char_count // 4
     
     # More refined approximation for code
-    if _is_likely_code(text):
+    if is_code:
         # Code tends to have more tokens due to symbols and structure
         token_estimate = int(char_count * 0.35)  # ~2.85 chars per token
     
     # Count words as additional check
-    words = re.findall(r'\b\w+\b', text)
-    word_count = len(words)
     word_based_estimate = int(word_count * 1.3)  # ~0.75 words per token
     
     # Take the average of character and word estimates
@@ -42,18 +69,41 @@ def count_tokens(text: str, model: str = "gpt-4") -> int:
     return max(1, int(final_estimate))
 
 
+class TokenCounter:
+    """
+    Incremental count_tokens for text produced in pieces.
+    
+    None of the word or code-indicator patterns can match across a newline,
+    so feeding text split at newlines gives exactly count_tokens() of the
+    concatenation without ever holding the whole text.
+    """
+    
+    def __init__(self) -> None:
+        self.char_count = 0
+        self.word_count = 0
+        self._indicators = [False] * len(_CODE_INDICATOR_RES)
+    
+    def add(self, text: str) -> None:
+        """Account for the next piece of text."""
+        self.char_count += len(text)
+        self.word_count += len(_WORD_RE.findall(text))
+        for i, pattern in enumerate(_CODE_INDICATOR_RES):
+            if not self._indicators[i] and pattern.search(text):
+                self._indicators[i] = True
+    
+    @property
+    def total(self) -> int:
+        """Token estimate for everything added so far."""
+        if not self.char_count:
+            return 0
+        return _estimate(self.char_count, self.word_count, sum(self._indicators) >= 2)
+
+
 def _is_likely_code(text: str) -> bool:
     """Determine if text is likely to be source code."""
-    code_indicators = [
-        r'\b(def|function|class|import|from|const|let|var)\b',
-        r'[{}()\[\];]',
-        r'//|/\*|#|"""|\'\'\'',
-        r'\b(if|else|for|while|return|try|catch)\b',
-    ]
-    
     indicator_count = 0
-    for pattern in code_indicators:
-        if re.search(pattern, text):
+    for pattern in _CODE_INDICATOR_RES:
+        if pattern.search(text):
             indicator_count += 1
     
     # If we find multiple code indicators, it's probably code
@@ -70,52 +120,53 @@ def format_token_count(tokens: int) -> str:
         return f"{tokens / 1000000:.1f}M tokens"
 
 
+_TOKEN_LIMITS = {
+    "gpt-3.5-turbo": {
+        "max_input": 4096,
+        "max_output": 4096,
+        "max_total": 4096
+    },
+    "gpt-4": {
+        "max_input": 8192,
+        "max_output": 8192,
+        "max_total": 8192
+    },
+    "gpt-4-turbo": {
+        "max_input": 128000,
+        "max_output": 4096,
+        "max_total": 128000
+    },
+    "gpt-4o": {
+        "max_input": 128000,
+        "max_output": 4096,
+        "max_total": 128000
+    },
+    "claude-3-haiku": {
+        "max_input": 200000,
+        "max_output": 4096,
+        "max_total": 200000
+    },
+    "claude-3-sonnet": {
+        "max_input": 200000,
+        "max_output": 4096,
+        "max_total": 200000
+    },
+    "claude-3-opus": {
+        "max_input": 200000,
+        "max_output": 4096,
+        "max_total": 200000
+    },
+    "claude-3.5-sonnet": {
+        "max_input": 200000,
+        "max_output": 8192,
+        "max_total": 200000
+    },
+}
+
+
 def get_token_limits(model: str = "gpt-4") -> dict:
     """Get token limits for different AI models."""
-    limits = {
-        "gpt-3.5-turbo": {
-            "max_input": 4096,
-            "max_output": 4096,
-            "max_total": 4096
-        },
-        "gpt-4": {
-            "max_input": 8192,
-            "max_output": 8192,
-            "max_total": 8192
-        },
-        "gpt-4-turbo": {
-            "max_input": 128000,
-            "max_output": 4096,
-            "max_total": 128000
-        },
-        "gpt-4o": {
-            "max_input": 128000,
-            "max_output": 4096,
-            "max_total": 128000
-        },
-        "claude-3-haiku": {
-            "max_input": 200000,
-            "max_output": 4096,
-            "max_total": 200000
-        },
-        "claude-3-sonnet": {
-            "max_input": 200000,
-            "max_output": 4096,
-            "max_total": 200000
-        },
-        "claude-3-opus": {
-            "max_input": 200000,
-            "max_output": 4096,
-            "max_total": 200000
-        },
-        "claude-3.5-sonnet": {
-            "max_input": 200000,
-            "max_output": 8192,
-            "max_total": 200000
-        },
-    }
-    
-    return limits.get(model, limits["gpt-4"])
+    return dict(_TOKEN_LIMITS.get(model, _TOKEN_LIMITS["gpt-4"]))
 
 
 def check_token_limits(tokens: int, model: str = "gpt-4") -> dict:
@@ -0,0 +1,18 @@
+"""Tests for the chat command group."""
+from typer.testing import CliRunner
+
+from ai_context_manager.cli import app
+from ai_context_manager.commands import chat_cmd
+
+
+def test_schema_is_read_once_per_process():
+    """`chat schema` prints the schema and reuses the cached file read."""
+    chat_cmd._load_schema_text.cache_clear()
+    runner = CliRunner()
+
+    for _ in range(2):
+        result = runner.invoke(app, ["chat", "schema"])
+        assert result.exit_code == 0
+        assert "AI Documentation Frontmatter" in result.output
+
+    assert chat_cmd._load_schema_text.cache_info().misses == 1
@@ -322,32 +322,30 @@ content:
     assert "See Also:    dashboard-cards, api-docs" in clean_output
 
 
-def test_count_files_and_folders():
-    """Test the file/folder counting logic."""
-    from ai_context_manager.commands.generate_cmd import _count_files_and_folders
-    from pathlib import Path
-    
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        base = Path(tmp_dir)
-        
-        # Create test structure
-        test_file = base / "test.txt"
-        test_file.write_text("content")
-        
-        test_dir = base / "subdir"
-        test_dir.mkdir()
-        
-        # Test counting
-        file_count, folder_count, missing_files = _count_files_and_folders(["test.txt", "subdir"], base)
-        assert file_count == 1
-        assert folder_count == 1
-        assert missing_files == []
-        
-        # Test non-existent paths (should be tracked as missing)
-        file_count, folder_count, missing_files = _count_files_and_folders(["nonexistent.txt"], base)
-        assert file_count == 0
-        assert folder_count == 0
-        assert missing_files == ["nonexistent.txt"]
+def test_generate_counts_files_and_folders(tmp_path: Path) -> None:
+    """The metadata block counts included files and folders separately."""
+    import re
+
+    (tmp_path / "test.txt").write_text("content")
+    (tmp_path / "subdir").mkdir()
+    selection_file = tmp_path / "selection.yaml"
+    with selection_file.open("w") as f:
+        yaml.dump(
+            {
+                "meta": {"description": "Counts"},
+                "content": {"basePath": str(tmp_path), "include": ["test.txt", "subdir"]},
+            },
+            f,
+        )
+
+    result = runner.invoke(
+        app, ["generate", "repomix", str(selection_file), "--output", str(tmp_path / "out.xml")]
+    )
+
+    assert result.exit_code == 0, result.output
+    clean_output = re.sub(r'\x1b\[[0-9;]*m', '', result.output)
+    assert "Files:       1" in clean_output
+    assert "Folders:     1" in clean_output
 
 
 def test_generate_repomix_warns_missing_files(tmp_path: Path) -> None:
@@ -498,4 +496,151 @@ content:
         # Check for tree view structure
         assert "Included Content" in clean_output
         assert "README.md" in clean_output
-        assert "src/" in clean_output
\ No newline at end of file
+        assert "src/" in clean_output
+
+
+def test_generate_reuses_cached_output_until_inputs_change(tmp_path: Path) -> None:
+    """With --cache, unchanged inputs reuse the cached XML; edits or a plain run regenerate."""
+    import os
+
+    from ai_context_manager.core.native_context.generator import NativeContextGenerator
+
+    selection_file = tmp_path / "selection.yaml"
+    with selection_file.open("w") as f:
+        yaml.dump({"basePath": str(tmp_path), "include": ["main.py"]}, f)
+    source = tmp_path / "main.py"
+    source.write_text("print('v1')")
+    output_file = tmp_path / "context.xml"
+    args = ["generate", "repomix", str(selection_file), "--output", str(output_file), "--cache"]
+
+    assert runner.invoke(app, args).exit_code == 0
+    output_file.unlink()
+
+    real_generate = NativeContextGenerator.generate_xml
+    with patch.object(NativeContextGenerator, "generate_xml", autospec=True, side_effect=real_generate) as spy:
+        assert runner.invoke(app, args).exit_code == 0
+        assert spy.call_count == 0
+        assert "print('v1')" in output_file.read_text()
+
+        assert runner.invoke(app, args[:-1]).exit_code == 0
+        assert spy.call_count == 1
+
+        source.write_text("print('v2')")
+        st = source.stat()
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert runner.invoke(app, args).exit_code == 0
+        assert spy.call_count == 2
+        assert "print('v2')" in output_file.read_text()
+
+
+def test_store_cached_output_bounds_entries_and_bytes(tmp_path: Path, monkeypatch) -> None:
+    """The output cache drops the oldest entries past its count or byte limit."""
+    import os
+
+    from ai_context_manager.commands import generate_cmd
+
+    monkeypatch.setattr(generate_cmd, "_MAX_CACHED_OUTPUTS", 3)
+    monkeypatch.setattr(generate_cmd, "_MAX_CACHED_BYTES", 25)
+    for i in range(4):
+        cache_file = tmp_path / f"{i}.xml"
+        generate_cmd._store_cached_output(cache_file, "x" * 10)
+        os.utime(cache_file, ns=(i * 1_000_000_000, i * 1_000_000_000))
+    generate_cmd._store_cached_output(tmp_path / "4.xml", "x" * 10)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["3.xml", "4.xml"]
+
+    generate_cmd._store_cached_output(tmp_path / "big.xml", "x" * 26)
+    assert not (tmp_path / "big.xml").exists()
+    # The limit is on encoded bytes: 13 characters, 26 bytes
+    generate_cmd._store_cached_output(tmp_path / "wide.xml", "é" * 13)
+    assert not (tmp_path / "wide.xml").exists()
+
+
+def test_load_selection_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    """Repeat loads of an unchanged selection file skip the YAML parse."""
+    import os
+
+    from ai_context_manager.commands.generate_cmd import _load_selection
+
+    selection_file = tmp_path / "selection.yaml"
+    selection_file.write_text(yaml.dump({"basePath": ".", "include": ["a.py"]}))
+
+    first = _load_selection(selection_file)
+    assert _load_selection(selection_file) is first
+
+    selection_file.write_text(yaml.dump({"basePath": ".", "include": ["b.py"]}))
+    st = selection_file.stat()
+    os.utime(selection_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert _load_selection(selection_file)["content"]["include"] == ["b.py"]
+
+
+def test_generate_dedupes_selection_files_by_resolved_path(tmp_path: Path, monkeypatch) -> None:
+    """The same selection named through different relative paths is processed once."""
+    monkeypatch.chdir(tmp_path)
+    selection_file = tmp_path / "selection.yaml"
+    with selection_file.open("w") as f:
+        yaml.dump({"basePath": ".", "include": ["main.py"]}, f)
+    (tmp_path / "main.py").write_text("print('hello')")
+    output_file = tmp_path / "context.xml"
+
+    result = runner.invoke(
+        app,
+        [
+            "generate",
+            "repomix",
+            "selection.yaml",
+            f"../{tmp_path.name}/selection.yaml",
+            "--output",
+            str(output_file),
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert result.output.count("Processing: selection.yaml") == 1
+
+
+def test_generate_stats_shared_include_items_once(tmp_path: Path) -> None:
+    """Include paths repeated across selections are stat'ed only once per run."""
+    from ai_context_manager.commands.generate_cmd import _path_mode
+
+    for name, include in (("one.yaml", ["main.py", "src"]), ("two.yaml", ["./main.py", "src/"])):
+        with (tmp_path / name).open("w") as f:
+            yaml.dump({"basePath": str(tmp_path), "include": include}, f)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "main.py").write_text("print('hello')")
+
+    result = runner.invoke(
+        app,
+        [
+            "generate",
+            "repomix",
+            str(tmp_path / "one.yaml"),
+            str(tmp_path / "two.yaml"),
+            "--output",
+            str(tmp_path / "context.xml"),
+        ],
+    )
+
+    assert result.exit_code == 0
+    info = _path_mode.cache_info()
+    assert (info.misses, info.hits) == (2, 2)
+
+
+def test_default_output_name_is_short_and_input_specific(tmp_path: Path) -> None:
+    """Merged selections and long tag lists get a stable digest suffix."""
+    from ai_context_manager.commands.generate_cmd import _default_output_name
+
+    one, two, three = (tmp_path / "one.yaml", tmp_path / "two.yaml", tmp_path / "three.yaml")
+
+    assert _default_output_name([one], None) == "one"
+    assert _default_output_name([one], ["api"]) == "context_api"
+
+    merged = _default_output_name([one, two], None)
+    assert merged.startswith("one_merged_") and len(merged) == len("one_merged_") + 8
+    assert _default_output_name([two, one], None).endswith(merged[-8:])
+    assert _default_output_name([one, three], None) != merged
+
+    long_tags = [f"tag{i:03d}" for i in range(40)]
+    name = _default_output_name([one], long_tags)
+    assert len(name) == len("context_") + 64 + 1 + 8
+    assert name != _default_output_name([one], long_tags[:-1] + ["other"])
@@ -198,3 +198,57 @@ def test_find_files_verbosity(tmp_path: Path) -> None:
     assert "Scanning 2 files" in result.output
     assert "api.yaml: Match" in result.output
     assert "ui.yaml: No match" in result.output
+
+
+def test_find_files_by_tags_skips_parse_without_tag_bytes(tmp_path: Path) -> None:
+    """Files whose raw bytes cannot contain a requested tag are never parsed."""
+    from ai_context_manager.commands import generate_cmd
+
+    base_path = tmp_path / "project"
+    base_path.mkdir()
+    api = create_mock_yaml(tmp_path, base_path, "api.yaml", ["api"], ["api.py"])
+    create_mock_yaml(tmp_path, base_path, "ui.yaml", ["frontend"], ["ui.vue"])
+
+    with patch.object(generate_cmd, "_parse_selection", wraps=generate_cmd._parse_selection) as spy:
+        matches = generate_cmd._find_files_by_tags(tmp_path, ["api"])
+
+    assert matches == [api]
+    assert [call.args[0] for call in spy.call_args_list] == [api.read_bytes()]
+
+
+def test_find_files_by_tags_reads_each_file_once_and_matches_utf16(tmp_path: Path) -> None:
+    """The prefilter's bytes are reused for the parse, and UTF-16 files are not ruled out."""
+    from ai_context_manager.commands import generate_cmd
+
+    base_path = tmp_path / "project"
+    base_path.mkdir()
+    api = create_mock_yaml(tmp_path, base_path, "api.yaml", ["api"], ["api.py"])
+    wide = tmp_path / "wide.yaml"
+    wide.write_text(api.read_text(), encoding="utf-16")
+
+    real_read_bytes = Path.read_bytes
+    with patch.object(Path, "read_bytes", autospec=True, side_effect=real_read_bytes) as spy:
+        matches = generate_cmd._find_files_by_tags(tmp_path, ["api"])
+
+    assert matches == [api, wide]
+    assert sorted(call.args[0].name for call in spy.call_args_list) == ["api.yaml", "wide.yaml"]
+
+    # A repeat scan of unchanged files is answered from the stat-keyed cache
+    with patch.object(Path, "read_bytes", autospec=True, side_effect=real_read_bytes) as spy:
+        assert generate_cmd._find_files_by_tags(tmp_path, ["api"]) == [api, wide]
+    assert spy.call_args_list == []
+
+
+def test_find_files_by_tags_parallel_scan_keeps_order(tmp_path: Path) -> None:
+    """Large directories are scanned in a pool but still match deterministically."""
+    from ai_context_manager.commands.generate_cmd import _find_files_by_tags
+
+    base_path = tmp_path / "project"
+    base_path.mkdir()
+    expected = [
+        create_mock_yaml(tmp_path, base_path, f"sel{i:02d}.yaml", ["api" if i % 3 == 0 else "ui"], ["a.py"])
+        for i in range(40)
+    ]
+    (tmp_path / "broken.yaml").write_text("meta: [api\n")
+
+    assert _find_files_by_tags(tmp_path, ["api"]) == expected[::3]
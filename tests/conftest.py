@@ -4,6 +4,21 @@ import tempfile
 from pathlib import Path
 import pytest
 
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep generated-output caches out of the real user cache directory."""
+    from ai_context_manager.config import get_cache_dir
+    from ai_context_manager.utils.clipboard import _which
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+    get_cache_dir.cache_clear()
+    # Tests patch shutil.which; drop lookups memoized by earlier tests.
+    _which.cache_clear()
+    yield
+    get_cache_dir.cache_clear()
+    _which.cache_clear()
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for testing."""
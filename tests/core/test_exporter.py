@@ -0,0 +1,107 @@
+"""Tests for the native ContextExporter."""
+import json
+
+import yaml
+
+from ai_context_manager.core.exporter import ContextExporter, _dumps_json
+from ai_context_manager.core.selection import Selection
+from ai_context_manager.utils.token_counter import count_tokens
+
+
+def test_dumps_json_matches_stdlib_output():
+    """The fast JSON path produces the same text as json.dumps(indent=2)."""
+    data = {
+        "metadata": {"generated_at": "2025-01-01T00:00:00", "summary": {"languages": {}, "total_files": 2}},
+        "files": [
+            {"path": "src/app.py", "content": 'print("héllo")\n\tx = "\\\\"\n'},
+            {"path": "empty.txt", "content": ""},
+        ],
+    }
+
+    assert _dumps_json(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _exporter_for(tmp_path, include):
+    selection_file = tmp_path / "selection.yaml"
+    selection_file.write_text(
+        yaml.dump(
+            {
+                "meta": {
+                    "description": "Exporter test",
+                    "createdAt": "2025-01-01",
+                    "createdBy": "tester",
+                    "updatedAt": "2025-01-01",
+                    "updatedBy": "tester",
+                    "documentType": "CONTEXT_DEFINITION",
+                },
+                "content": {"basePath": ".", "include": include},
+            }
+        )
+    )
+    return ContextExporter(Selection.load(selection_file))
+
+
+def test_markdown_export_streams_and_counts_tokens(tmp_path):
+    """Markdown is written straight to disk and its token count is exact."""
+    (tmp_path / "app.py").write_text("def main():\n    return 1\n")
+    (tmp_path / "notes.md").write_text("# Notes\nplain text")
+
+    output = tmp_path / "out" / "context.md"
+    result = _exporter_for(tmp_path, ["app.py", "notes.md"]).export_to_file(output)
+
+    text = output.read_text(encoding="utf-8")
+    assert result["success"] is True
+    assert result["total_tokens"] == count_tokens(text)
+    assert "### app.py\n```py\ndef main():\n    return 1\n\n```" in text
+    assert text.endswith("### notes.md\n```md\n# Notes\nplain text\n```\n")
+
+
+def test_large_json_export_keeps_file_order(tmp_path):
+    """Read-ahead for large selections still emits files in sorted order."""
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(40):
+        (src / f"f{i:02d}.txt").write_text(f"content {i}")
+
+    output = tmp_path / "context.json"
+    result = _exporter_for(tmp_path, ["src"]).export_to_file(output, format="json")
+
+    files = json.loads(output.read_text(encoding="utf-8"))["files"]
+    assert result["success"] is True
+    assert [f["path"] for f in files] == [f"src/f{i:02d}.txt" for i in range(40)]
+    assert [f["content"] for f in files] == [f"content {i}" for i in range(40)]
+
+
+def test_xml_export_escapes_paths_and_content(tmp_path):
+    """Hand-written XML round-trips special characters in paths and content."""
+    import xml.etree.ElementTree as ET
+
+    (tmp_path / 'a&b "q".txt').write_text("if a < b && c > d:\n\tpass")
+    (tmp_path / "empty.txt").write_text("")
+
+    output = tmp_path / "context.xml"
+    result = _exporter_for(tmp_path, ['a&b "q".txt', "empty.txt"]).export_to_file(output, format="xml")
+
+    root = ET.fromstring(output.read_text(encoding="utf-8"))
+    files = root.find("files").findall("file")
+    assert result["success"] is True
+    assert [f.get("path") for f in files] == ['a&b "q".txt', "empty.txt"]
+    assert files[0].text == "if a < b && c > d:\n\tpass"
+    assert files[1].text is None
+
+
+def test_failed_export_leaves_existing_output_untouched(tmp_path, monkeypatch):
+    """A document that fails to build does not truncate the previous output."""
+    (tmp_path / "a.txt").write_text("a")
+    output = tmp_path / "context.json"
+    output.write_text("previous")
+    exporter = _exporter_for(tmp_path, ["a.txt"])
+
+    def fail(*args):
+        raise ValueError("boom")
+
+    monkeypatch.setattr(exporter, "_export_json", fail)
+    result = exporter.export_to_file(output, format="json")
+
+    assert result["success"] is False
+    assert output.read_text() == "previous"
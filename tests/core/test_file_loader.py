@@ -0,0 +1,37 @@
+"""Tests for the native FileLoader."""
+from ai_context_manager.core.native_context.file_loader import FileLoader
+
+
+def test_overlapping_patterns_read_each_file_once(tmp_path, monkeypatch):
+    """A file matched by several patterns is read and returned only once."""
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "app.py").write_text("app")
+    (tmp_path / "src" / "pkg" / "mod.py").write_text("mod")
+
+    loader = FileLoader()
+    reads = []
+    original = loader._read_file_safely
+
+    def counting_read(file_path):
+        reads.append(file_path.name)
+        return original(file_path)
+
+    monkeypatch.setattr(loader, "_read_file_safely", counting_read)
+
+    files = loader.load(tmp_path, ["src/**", "src/pkg/**", "src/app.py"])
+
+    assert [f.path for f in files] == ["src/app.py", "src/pkg/mod.py"]
+    assert [f.content for f in files] == ["app", "mod"]
+    assert sorted(reads) == ["app.py", "mod.py"]
+
+
+def test_parallel_read_keeps_sorted_order(tmp_path):
+    """Selections large enough for the thread pool still come back sorted."""
+    (tmp_path / "src").mkdir()
+    for i in range(50):
+        (tmp_path / "src" / f"f{i:02d}.txt").write_text(str(i))
+
+    files = FileLoader().load(tmp_path, ["src/**"])
+
+    assert [f.path for f in files] == [f"src/f{i:02d}.txt" for i in range(50)]
+    assert [f.content for f in files] == [str(i) for i in range(50)]
@@ -64,3 +64,28 @@ def test_xml_renderer_escaping():
     # Should be properly escaped
     assert "&lt;" in result or "&gt;" in result or "&amp;" in result
     assert "Content with" in result
+
+
+def test_xml_renderer_layout():
+    """Test the exact pretty-printed layout, including empty elements."""
+    renderer = XmlContextRenderer()
+    
+    payload = ContextRenderInput(
+        generation_header="Header",
+        tree_string="",
+        files=[
+            ContextFile(path='a "b".py', content="x = 1\r\nif a < b: pass"),
+            ContextFile(path="empty.txt", content=""),
+        ]
+    )
+    
+    assert renderer.render(payload) == (
+        "<repomix>\n"
+        "  <file_summary>Header</file_summary>\n"
+        "  <directory_structure/>\n"
+        "  <files>\n"
+        '    <file path="a &quot;b&quot;.py">x = 1\nif a &lt; b: pass</file>\n'
+        '    <file path="empty.txt"/>\n'
+        "  </files>\n"
+        "</repomix>\n"
+    )
@@ -0,0 +1,81 @@
+"""Tests for the Selection model."""
+import os
+
+import pytest
+import yaml
+
+from ai_context_manager.core.selection import Selection
+
+
+def _write_selection(path, include):
+    path.write_text(
+        yaml.dump(
+            {
+                "meta": {
+                    "description": "Test selection",
+                    "createdAt": "2025-01-01",
+                    "createdBy": "tester",
+                    "updatedAt": "2025-01-01",
+                    "updatedBy": "tester",
+                    "documentType": "CONTEXT_DEFINITION",
+                },
+                "content": {"basePath": ".", "include": include},
+            }
+        )
+    )
+
+
+def test_load_is_cached_until_file_changes(tmp_path):
+    """Repeated loads reuse the parsed YAML until the file is modified."""
+    selection_file = tmp_path / "selection.yaml"
+    _write_selection(selection_file, ["a.py"])
+
+    first = Selection.load(selection_file)
+    misses = Selection._load_cached.cache_info().misses
+    second = Selection.load(selection_file)
+    assert Selection._load_cached.cache_info().misses == misses
+    assert first.include_paths == [tmp_path / "a.py"]
+
+    # Each load hands out its own instance; mutations do not leak
+    first.include_paths.append(tmp_path / "x.py")
+    first.meta.tags.append("mutated")
+    assert second is not first
+    assert second.include_paths == [tmp_path / "a.py"]
+    assert Selection.load(selection_file).meta.tags == []
+
+    _write_selection(selection_file, ["a.py", "b.py"])
+    stat = selection_file.stat()
+    os.utime(selection_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    reloaded = Selection.load(selection_file)
+    assert Selection._load_cached.cache_info().misses == misses + 1
+    assert reloaded.include_paths == [tmp_path / "a.py", tmp_path / "b.py"]
+
+
+def test_schema_validator_is_built_once(tmp_path):
+    """Loading several selections parses and checks the schema only once."""
+    from ai_context_manager.core.selection import _schema_validator
+
+    _schema_validator.cache_clear()
+    for name in ("one.yaml", "two.yaml"):
+        _write_selection(tmp_path / name, ["a.py"])
+        Selection.load(tmp_path / name)
+
+    info = _schema_validator.cache_info()
+    assert info.misses == 1
+    assert info.hits >= 1
+
+
+def test_schema_errors_report_path(tmp_path):
+    """Validation failures still name the offending field."""
+    selection_file = tmp_path / "bad.yaml"
+    selection_file.write_text(yaml.dump({"meta": {}, "content": {"basePath": "."}}))
+
+    with pytest.raises(ValueError, match="Schema Validation Error at"):
+        Selection.load(selection_file)
+
+
+def test_load_missing_file_raises_file_not_found(tmp_path):
+    """A missing selection file is reported with its path."""
+    with pytest.raises(FileNotFoundError, match="Selection file not found"):
+        Selection.load(tmp_path / "missing.yaml")
@@ -18,3 +18,90 @@ def test_help():
     assert "select" in result.output
     assert "export" in result.output
     assert "generate" in result.output
+
+
+def test_help_lists_lazy_subcommands_without_importing(capsys):
+    """Root help shows lazily registered subcommands without loading them."""
+    import typer
+    from ai_context_manager.cli import LAZY_SUBCOMMANDS
+
+    group = typer.main.get_command(app)
+    help_text = group.get_help(typer.Context(group, info_name="aicontext"))
+    help_text += capsys.readouterr().out
+    assert "Native: Generate context from selection.yaml" in help_text
+    assert "RAG: Index selections & ask questions" in help_text
+    assert set(LAZY_SUBCOMMANDS).isdisjoint(group.commands)
+
+
+def test_lazy_subcommand_resolves_on_invoke():
+    """Invoking a lazy subcommand imports and runs it."""
+    runner = CliRunner()
+    result = runner.invoke(app, ["generate", "--help"])
+    assert result.exit_code == 0
+    assert "tags" in result.output
+    assert "repomix" in result.output
+
+
+def test_version_fast_path_skips_typer():
+    """`aicontext --version` is answered before Typer is imported."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; sys.argv = ['aicontext', '--version']\n"
+        "from ai_context_manager.__main__ import main\n"
+        "main()\n"
+        "print('typer' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == ["AI Context Manager v0.2.0 (Visual Edition)", "False"]
+
+
+def test_importing_cli_with_version_argv_does_not_exit():
+    """Importing the CLI module never exits, whatever sys.argv holds."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; sys.argv = ['host', 'version']\n"
+        "import ai_context_manager.cli\n"
+        "print('imported')\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == ["imported"]
+
+
+def test_help_does_not_import_command_modules():
+    """`aicontext --help` leaves every command module unloaded."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from ai_context_manager.cli import app, LAZY_SUBCOMMANDS\n"
+        "result = CliRunner().invoke(app, ['--help'])\n"
+        "assert result.exit_code == 0, result.output\n"
+        "print(sorted(m for m, _ in LAZY_SUBCOMMANDS.values() if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_module_entry_version_skips_typer():
+    """`python -m ai_context_manager --version` never imports Typer."""
+    import subprocess
+    import sys
+
+    code = (
+        "import runpy, sys\n"
+        "sys.argv = ['ai_context_manager', '--version']\n"
+        "runpy.run_module('ai_context_manager', run_name='__main__')\n"
+        "print('typer' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines()[-1] == "False"
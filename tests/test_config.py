@@ -236,3 +236,17 @@ class TestConfig:
             # Should raise meaningful exception
             assert "json" in str(e).lower() or "parse" in str(e).lower()
     
+
+
+def test_get_cache_dir_honours_xdg_cache_home(tmp_path, monkeypatch):
+    """The cache dir follows XDG_CACHE_HOME and is created on demand."""
+    from ai_context_manager.config import get_cache_dir
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    get_cache_dir.cache_clear()
+    try:
+        cache_dir = get_cache_dir()
+        assert cache_dir == tmp_path / "ai-context-manager"
+        assert cache_dir.is_dir()
+    finally:
+        get_cache_dir.cache_clear()
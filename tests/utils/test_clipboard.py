@@ -0,0 +1,18 @@
+"""Tests for clipboard utilities."""
+from unittest.mock import patch
+
+from ai_context_manager.utils.clipboard import is_xclip_installed
+
+
+def test_xclip_lookup_is_cached_per_path(monkeypatch):
+    """The PATH probe runs once per $PATH value, not on every call."""
+    monkeypatch.setenv("PATH", "/opt/one")
+    with patch("shutil.which", return_value="/opt/one/xclip") as mock_which:
+        assert is_xclip_installed() is True
+        assert is_xclip_installed() is True
+        assert mock_which.call_count == 1
+
+        monkeypatch.setenv("PATH", "/opt/two")
+        mock_which.return_value = None
+        assert is_xclip_installed() is False
+        assert mock_which.call_count == 2
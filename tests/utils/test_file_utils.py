@@ -7,13 +7,17 @@ import pytest
 
 from ai_context_manager.utils.file_utils import (
     collect_files,
+    fast_line_count,
     filter_files_by_patterns,
     get_file_size,
     get_file_info,
     is_binary_file,
     is_text_file,
+    iter_files,
+    matches_pattern,
     read_file_content,
     should_include_file,
+    write_text_atomic,
 )
 
 
@@ -66,6 +70,35 @@ class TestFileUtils:
         content = read_file_content(empty_file)
         assert content == ""
 
+    def test_read_file_content_max_chars_reads_prefix(self, temp_dir: Path, monkeypatch) -> None:
+        """Test max_chars reads a bounded prefix but still returns whole characters."""
+        import builtins
+
+        text_file = temp_dir / "wide.txt"
+        text_file.write_text("é\r\n" * 5000, encoding="utf-8")
+        sizes = []
+        real_open = builtins.open
+
+        def recording_open(*args, **kwargs):
+            handle = real_open(*args, **kwargs)
+            real_read = handle.read
+            handle.read = lambda size=-1: sizes.append(size) or real_read(size)
+            return handle
+
+        monkeypatch.setattr(builtins, "open", recording_open)
+        content = read_file_content(text_file, max_chars=3000)
+
+        assert content == ("é\n" * 1500)
+        assert sizes == [12000]
+
+    def test_read_file_content_max_chars_reads_past_invalid_bytes(self, temp_dir: Path) -> None:
+        """Test max_chars keeps reading when dropped invalid bytes leave too few characters."""
+        text_file = temp_dir / "mixed.txt"
+        text_file.write_bytes(b"\xff" * 5000 + b"abc" * 1000)
+
+        assert read_file_content(text_file, max_chars=10) == "abcabcabca"
+        assert read_file_content(text_file, max_chars=5000) == ("abc" * 1000)
+
     def test_should_include_file_basic(self, sample_files: dict[str, Path]) -> None:
         """Test basic file inclusion logic."""
         # Include Python files
@@ -190,6 +223,101 @@ class TestFileUtils:
         assert target_file in files
         assert symlink_file in files
 
+    def test_iter_files_walks_tree(self, temp_dir: Path) -> None:
+        """Test scandir-based walking of nested directories."""
+        (temp_dir / "pkg" / "sub").mkdir(parents=True)
+        (temp_dir / "top.py").write_text("x")
+        (temp_dir / "pkg" / "a.py").write_text("x")
+        (temp_dir / "pkg" / "sub" / "b.py").write_text("x")
+        (temp_dir / "linked").symlink_to(temp_dir / "pkg", target_is_directory=True)
+
+        found = sorted(Path(p).relative_to(temp_dir).as_posix() for p in iter_files(temp_dir))
+        assert found == ["pkg/a.py", "pkg/sub/b.py", "top.py"]
+
+        shallow = [Path(p).name for p in iter_files(temp_dir, recursive=False)]
+        assert shallow == ["top.py"]
+
+    def test_collect_files_prunes_excluded_directories(self, temp_dir: Path, monkeypatch) -> None:
+        """Directories fully covered by a ``dir/*`` exclude are skipped, same result."""
+        from ai_context_manager.utils import file_utils
+
+        for rel in ["src/a.py", "src/build/b.py", "build/c.py", ".git/objects/d", "docs/.git.md"]:
+            (temp_dir / rel).parent.mkdir(parents=True, exist_ok=True)
+            (temp_dir / rel).write_text("x")
+        excludes = ["*/build/*", "*/.git/*", "*.md"]
+
+        expected = sorted(
+            Path(p) for p in iter_files(temp_dir) if not matches_pattern(Path(p), excludes)
+        )
+
+        scanned = []
+        real_scandir = os.scandir
+
+        def recording_scandir(path):
+            scanned.append(os.path.relpath(path, temp_dir))
+            return real_scandir(path)
+
+        monkeypatch.setattr(file_utils.os, "scandir", recording_scandir)
+        files = collect_files(temp_dir, exclude_patterns=excludes)
+        monkeypatch.undo()
+
+        assert files == expected
+        assert [f.relative_to(temp_dir).as_posix() for f in files] == ["src/a.py"]
+        assert not {"build", ".git", os.path.join("src", "build")} & set(scanned)
+
+    def test_matches_pattern_agrees_with_fnmatch(self) -> None:
+        """Test suffix/literal fast paths match fnmatch semantics."""
+        import fnmatch
+
+        patterns = ["*", "*.py", "Makefile", "src/*", "*/test_*.py", "*.tar.gz", "a[bc].txt", "?.py"]
+        paths = ["src/a.py", "Makefile", "dir/Makefile", "a.tar.gz", "ab.txt", "b.py", "tests/test_a.py", "x"]
+        for pattern in patterns:
+            for raw in paths:
+                path = Path(raw)
+                expected = fnmatch.fnmatch(str(path), pattern) or fnmatch.fnmatch(path.name, pattern)
+                assert matches_pattern(path, [pattern]) == expected, (pattern, raw)
+
+    def test_write_text_atomic(self, temp_dir: Path) -> None:
+        """Test atomic writes skip unchanged content and leave no temp file."""
+        target = temp_dir / "out.xml"
+        assert write_text_atomic(target, "<a/>")
+        assert target.read_text() == "<a/>"
+        assert not write_text_atomic(target, "<a/>")
+        assert write_text_atomic(target, "<b/>")
+        assert target.read_text() == "<b/>"
+        assert [p.name for p in temp_dir.iterdir()] == ["out.xml"]
+
+    def test_write_text_atomic_keeps_symlink_mode_and_tmp_neighbour(self, temp_dir: Path) -> None:
+        """Test writes go through symlinks, keep the mode and leave <name>.tmp alone."""
+        real = temp_dir / "real.txt"
+        real.write_text("old")
+        real.chmod(0o640)
+        link = temp_dir / "link.txt"
+        link.symlink_to(real)
+        (temp_dir / "link.txt.tmp").write_text("unrelated")
+
+        assert write_text_atomic(link, "new")
+
+        assert link.is_symlink()
+        assert real.read_text() == "new"
+        assert stat.S_IMODE(real.stat().st_mode) == 0o640
+        assert (temp_dir / "link.txt.tmp").read_text() == "unrelated"
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["link.txt", "link.txt.tmp", "real.txt"]
+
+    def test_write_text_atomic_failure_removes_temp_file(self, temp_dir: Path, monkeypatch) -> None:
+        """Test a failed replace does not leave a temp file behind."""
+        def failing_replace(src, dst):
+            raise OSError("boom")
+
+        monkeypatch.setattr(os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            write_text_atomic(temp_dir / "out.xml", "<a/>")
+        assert list(temp_dir.iterdir()) == []
+
+    def test_write_text_atomic_writes_devices_directly(self) -> None:
+        """Test non-regular targets such as /dev/null are written in place."""
+        assert write_text_atomic(Path("/dev/null"), "<a/>")
+
     def test_should_include_file_permission_denied(self, temp_dir: Path) -> None:
         """Test handling permission denied scenarios."""
         restricted_file = temp_dir / "restricted.txt"
@@ -293,4 +421,30 @@ class TestFileUtils:
         assert info["size"] == 4
         assert info["lines"] == 0  # Binary files have 0 lines
         assert info["is_text"] is False
-        assert info["exists"] is True
\ No newline at end of file
+        assert info["exists"] is True
+
+    def test_fast_line_count_matches_splitlines(self, temp_dir: Path) -> None:
+        """Test that byte-level line counting agrees with decoded splitlines."""
+        samples = [b"", b"one", b"one\n", b"a\nb", b"a\r\nb\r\n", b"a\rb\r", b"\n\n", "hé\nx".encode()]
+        samples += [
+            b"a\x0bb\x0cc\x1cd\x1de\x1e",
+            "a\x85b\u2028c\u2029".encode(),
+            "page\x0c\r\nnext\u2029".encode(),
+        ]
+        for i, data in enumerate(samples):
+            path = temp_dir / f"sample_{i}.txt"
+            path.write_bytes(data)
+            assert fast_line_count(path) == len(read_file_content(path).splitlines())
+
+        binary = temp_dir / "data.bin"
+        binary.write_bytes(b"\x00\n\n")
+        assert fast_line_count(binary) == 0
+        assert fast_line_count(temp_dir / "missing.txt") == 0
+
+    def test_read_file_content_normalizes_newlines(self, temp_dir: Path) -> None:
+        """Test that byte-level reads keep text-mode newline handling."""
+        path = temp_dir / "crlf.txt"
+        path.write_bytes(b"one\r\ntwo\rthree\n\xff")
+
+        assert read_file_content(path) == "one\ntwo\nthree\n"
+        assert read_file_content(path, max_chars=5) == "one\nt"
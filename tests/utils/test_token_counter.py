@@ -1,7 +1,7 @@
 """Tests for token counter utility."""
 import pytest
 
-from ai_context_manager.utils.token_counter import count_tokens
+from ai_context_manager.utils.token_counter import TokenCounter, count_tokens, get_token_limits
 
 
 class TestTokenCounter:
@@ -147,4 +147,36 @@ class TestTokenCounter:
         """Test counting tokens with HTML tags."""
         html = "<div><p>Hello <strong>world</strong>!</p></div>"
         tokens = count_tokens(html)
-        assert tokens >= 3  # Should count text content, not just tags
\ No newline at end of file
+        assert tokens >= 3  # Should count text content, not just tags
+
+    def test_get_token_limits_returns_independent_copies(self) -> None:
+        """Test that limits come from the shared table without exposing it."""
+        limits = get_token_limits("gpt-4o")
+        assert limits["max_input"] == 128000
+        limits["max_input"] = 1
+        assert get_token_limits("gpt-4o")["max_input"] == 128000
+        assert get_token_limits("unknown-model") == get_token_limits("gpt-4")
+
+    def test_token_counter_matches_count_tokens(self) -> None:
+        """Test that counting newline-split pieces matches the whole text."""
+        texts = [
+            "",
+            "plain prose\nwith two lines",
+            "def f():\n    return {'a': 1}  # note\n",
+            "x = 1\n//\n/*\n\"\"\"\n",
+        ]
+        for text in texts:
+            counter = TokenCounter()
+            for piece in text.splitlines(keepends=True):
+                counter.add(piece)
+            assert counter.total == count_tokens(text)
+
+    def test_count_tokens_caches_large_texts(self, monkeypatch) -> None:
+        """Test that large texts are counted once and then served from cache."""
+        from ai_context_manager.utils import token_counter
+
+        text = "word " * 2000
+        expected = count_tokens(text)
+        monkeypatch.setattr(token_counter, "_estimate", lambda *args: pytest.fail("cache miss"))
+
+        assert count_tokens(text) == expected